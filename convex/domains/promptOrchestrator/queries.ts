@@ -238,11 +238,13 @@ export const getByIdInternal = internalQuery({
 
 /**
  * Internal query to get prompt by key (for HTTP API)
+ * Resolves the given version number, or the active version if none is given.
  */
 export const getByKeyInternal = internalQuery({
   args: {
     projectId: v.id("projects"),
     key: v.string(),
+    version: v.optional(v.number()),
   },
   handler: async (ctx, args) => {
     const prompt = await ctx.db
@@ -254,18 +256,75 @@ export const getByKeyInternal = internalQuery({
 
     if (!prompt) return null;
 
-    let activeVersion = null;
-    if (prompt.activeVersionId) {
-      activeVersion = await ctx.db.get(prompt.activeVersionId);
-    }
+    const versionNumber = args.version;
+    const version =
+      versionNumber !== undefined
+        ? await ctx.db
+            .query("promptVersions")
+            .withIndex("by_prompt_version", (q) =>
+              q.eq("promptId", prompt._id).eq("versionNumber", versionNumber)
+            )
+            .first()
+        : prompt.activeVersionId
+          ? await ctx.db.get(prompt.activeVersionId)
+          : null;
 
     return {
       ...prompt,
-      activeVersion,
+      version,
     };
   },
 });
 
+/**
+ * Internal query to get several prompts by key (for HTTP batch API)
+ * Resolves the given version number, or the active version if none is given.
+ * Unknown keys are omitted from the result
+ */
+export const getByKeysInternal = internalQuery({
+  args: {
+    projectId: v.id("projects"),
+    keys: v.array(v.string()),
+    version: v.optional(v.number()),
+  },
+  handler: async (ctx, args) => {
+    const prompts = await Promise.all(
+      args.keys.map(async (key) => {
+        const prompt = await ctx.db
+          .query("prompts")
+          .withIndex("by_key", (q) =>
+            q.eq("projectId", args.projectId).eq("key", key)
+          )
+          .unique();
+
+        if (!prompt) return null;
+
+        const versionNumber = args.version;
+        const version =
+          versionNumber !== undefined
+            ? await ctx.db
+                .query("promptVersions")
+                .withIndex("by_prompt_version", (q) =>
+                  q.eq("promptId", prompt._id).eq("versionNumber", versionNumber)
+                )
+                .first()
+            : prompt.activeVersionId
+              ? await ctx.db.get(prompt.activeVersionId)
+              : null;
+
+        return {
+          ...prompt,
+          version,
+        };
+      })
+    );
+
+    return prompts.filter(
+      (prompt): prompt is NonNullable<typeof prompt> => prompt !== null
+    );
+  },
+});
+
 /**
  * Internal query to list all prompts for a project (for sync)
  */
@@ -6,8 +6,8 @@ import { httpRouter } from "convex/server";
 
 import { deploy, validateApiKey } from "./routes/cliAuth";
 import { editPromptStream } from "./routes/editPromptStream";
-import { getLog, getLogs, logSpan } from "./routes/logs";
-import { getPromptByKey } from "./routes/prompts";
+import { getLog, getLogs, logSpan, logSpanBatch } from "./routes/logs";
+import { getPromptByKey, getPromptsBatch } from "./routes/prompts";
 import {
   createPrompt,
   createVersion,
@@ -62,6 +62,12 @@ http.route({
   handler: deletePrompt,
 });
 
+http.route({
+  path: "/api/prompts/batch",
+  method: "POST",
+  handler: getPromptsBatch,
+});
+
 http.route({
   path: "/api/prompts/versions",
   method: "POST",
@@ -121,6 +127,12 @@ http.route({
   handler: logSpan,
 });
 
+http.route({
+  path: "/api/log/batch",
+  method: "POST",
+  handler: logSpanBatch,
+});
+
 http.route({
   path: "/api/logs",
   method: "GET",
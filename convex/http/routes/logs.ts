@@ -317,3 +317,157 @@ export const getLog = httpAction(async (ctx, request) => {
     );
   }
 });
+
+const MAX_BATCH_EVENTS = 100;
+
+/**
+ * POST /api/log/batch - Log several spans in one request
+ * Header: X-API-Key: fp_proj_xxx
+ * Body: { events: [{ traceId, promptKey, type, ... }] }
+ *
+ * Events are written in order. Each event takes the same fields as POST /api/log.
+ * An event that fails to write doesn't stop the rest of the batch; failures are
+ * reported per event.
+ *
+ * Response: { success, count, errors: [{ index, error }] }
+ *   count is the number of events written; errors lists the ones that weren't.
+ *
+ * Rate Limit: 500 requests per minute (log_span)
+ */
+export const logSpanBatch = httpAction(async (ctx, request) => {
+  // Get API key from header
+  const apiKey = request.headers.get("X-API-Key");
+  if (!apiKey) {
+    return new Response(
+      JSON.stringify({ error: "API key required" }),
+      {
+        status: 401,
+        headers: { "Content-Type": "application/json" },
+      }
+    );
+  }
+
+  // Check rate limit
+  const rateLimitId = extractRateLimitIdentifier(request);
+  const rateLimitResult = await checkHttpRateLimit(ctx, "log_span", rateLimitId);
+  if (!rateLimitResult.allowed) {
+    return createRateLimitResponse(rateLimitResult);
+  }
+
+  try {
+    // Validate API key and get project
+    const projectId = await ctx.runQuery(
+      internal.domains.projectApiKeys.queries.verifyApiKeyInternal,
+      { apiKey }
+    );
+
+    if (!projectId) {
+      return addRateLimitHeaders(
+        new Response(
+          JSON.stringify({ error: "Invalid API key" }),
+          {
+            status: 401,
+            headers: { "Content-Type": "application/json" },
+          }
+        ),
+        rateLimitResult
+      );
+    }
+
+    // Parse request body
+    const body = await request.json();
+    const events = body?.events;
+
+    if (!Array.isArray(events) || events.length > MAX_BATCH_EVENTS) {
+      return addRateLimitHeaders(
+        new Response(
+          JSON.stringify({
+            error: `events must be an array of at most ${MAX_BATCH_EVENTS} spans`,
+          }),
+          {
+            status: 400,
+            headers: { "Content-Type": "application/json" },
+          }
+        ),
+        rateLimitResult
+      );
+    }
+
+    // Validate required fields before writing anything
+    for (const event of events) {
+      if (!event?.traceId || !event?.promptKey || !event?.type) {
+        return addRateLimitHeaders(
+          new Response(
+            JSON.stringify({ error: "traceId, promptKey, and type are required" }),
+            {
+              status: 400,
+              headers: { "Content-Type": "application/json" },
+            }
+          ),
+          rateLimitResult
+        );
+      }
+    }
+
+    // Log the spans sequentially so a trace is created by its first span.
+    // Each mutation commits on its own, so one bad event must not hide
+    // which of the others were written.
+    const errors: { index: number; error: string }[] = [];
+    for (const [index, event] of events.entries()) {
+      try {
+        await ctx.runMutation(
+          api.domains.logs.mutations.logSpan,
+          {
+            projectId,
+            traceId: event.traceId,
+            promptKey: event.promptKey,
+            versionNumber: event.versionNumber,
+            type: event.type,
+            role: event.role,
+            content: event.content,
+            model: event.model,
+            inputTokens: event.inputTokens,
+            outputTokens: event.outputTokens,
+            durationMs: event.durationMs,
+            source: event.source,
+            metadata: event.metadata,
+          }
+        );
+      } catch (error: unknown) {
+        console.error(`Error logging span ${index} of batch:`, error);
+        errors.push({
+          index,
+          error: error instanceof Error ? error.message : "Internal server error",
+        });
+      }
+    }
+
+    return addRateLimitHeaders(
+      new Response(
+        JSON.stringify({
+          success: errors.length === 0,
+          count: events.length - errors.length,
+          errors,
+        }),
+        {
+          status: 200,
+          headers: { "Content-Type": "application/json" },
+        }
+      ),
+      rateLimitResult
+    );
+  } catch (error: unknown) {
+    console.error("Error logging span batch:", error);
+    const message = error instanceof Error ? error.message : "Internal server error";
+    return addRateLimitHeaders(
+      new Response(
+        JSON.stringify({ error: message }),
+        {
+          status: 500,
+          headers: { "Content-Type": "application/json" },
+        }
+      ),
+      rateLimitResult
+    );
+  }
+});
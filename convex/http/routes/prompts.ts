@@ -14,7 +14,7 @@ import {
 
 /**
  * GET /api/prompts
- * Returns the active version of a prompt by its key
+ * Returns a prompt by its key, at the requested or the active version
  *
  * Query params:
  *   - key: Prompt key (required)
@@ -65,6 +65,21 @@ export const getPromptByKey = httpAction(async (ctx, request) => {
     );
   }
 
+  const version =
+    versionParam === null ? undefined : Number(versionParam);
+  if (version !== undefined && (!Number.isInteger(version) || version < 1)) {
+    return addRateLimitHeaders(
+      new Response(
+        JSON.stringify({ error: "version must be a positive integer" }),
+        {
+          status: 400,
+          headers: { "Content-Type": "application/json" },
+        }
+      ),
+      rateLimitResult
+    );
+  }
+
   try {
     // Get project from API key
     const project = await ctx.runQuery(
@@ -90,6 +105,7 @@ export const getPromptByKey = httpAction(async (ctx, request) => {
       {
         projectId: project.projectId as Id<"projects">,
         key,
+        version,
       }
     );
 
@@ -106,10 +122,15 @@ export const getPromptByKey = httpAction(async (ctx, request) => {
       );
     }
 
-    if (!promptWithVersion.activeVersion) {
+    if (!promptWithVersion.version) {
       return addRateLimitHeaders(
         new Response(
-          JSON.stringify({ error: `No active version for prompt "${key}"` }),
+          JSON.stringify({
+            error:
+              version !== undefined
+                ? `Version ${version} not found for prompt "${key}"`
+                : `No active version for prompt "${key}"`,
+          }),
           {
             status: 404,
             headers: { "Content-Type": "application/json" },
@@ -119,17 +140,15 @@ export const getPromptByKey = httpAction(async (ctx, request) => {
       );
     }
 
-    // TODO: Handle specific version request if versionParam is provided
-
     return addRateLimitHeaders(
       new Response(
         JSON.stringify({
           key: promptWithVersion.key,
           name: promptWithVersion.name,
           description: promptWithVersion.description,
-          versionNumber: promptWithVersion.activeVersion.versionNumber,
-          systemPrompt: promptWithVersion.activeVersion.systemPrompt,
-          updatedAt: promptWithVersion.activeVersion.updatedAt,
+          versionNumber: promptWithVersion.version.versionNumber,
+          systemPrompt: promptWithVersion.version.systemPrompt,
+          updatedAt: promptWithVersion.version.updatedAt,
           // Additional metadata
           purpose: promptWithVersion.purpose,
           expectedBehavior: promptWithVersion.expectedBehavior,
@@ -165,3 +184,192 @@ export const getPromptByKey = httpAction(async (ctx, request) => {
   }
 });
 
+
+/**
+ * Maximum number of keys accepted by a single batch request
+ */
+const MAX_BATCH_KEYS = 100;
+
+/**
+ * POST /api/prompts/batch
+ * Returns several prompts in one request, at the requested or the active
+ * version
+ *
+ * Headers:
+ *   - X-API-Key: Project API key (required)
+ *
+ * Body:
+ *   - keys: Array of prompt keys (required, max 100)
+ *   - version: Specific version number (optional)
+ *
+ * Rate Limit: 200 requests per minute (prompt_fetch)
+ *
+ * Response:
+ *   { prompts: { [key]: { key, name, versionNumber, systemPrompt, ... } } }
+ *   Prompts that don't exist, or lack the requested (or an active) version,
+ *   are omitted.
+ */
+export const getPromptsBatch = httpAction(async (ctx, request) => {
+  const apiKey = request.headers.get("X-API-Key");
+
+  if (!apiKey) {
+    return new Response(
+      JSON.stringify({ error: "Missing X-API-Key header" }),
+      {
+        status: 401,
+        headers: { "Content-Type": "application/json" },
+      }
+    );
+  }
+
+  // Check rate limit
+  const rateLimitId = extractRateLimitIdentifier(request);
+  const rateLimitResult = await checkHttpRateLimit(ctx, "prompt_fetch", rateLimitId);
+  if (!rateLimitResult.allowed) {
+    return createRateLimitResponse(rateLimitResult);
+  }
+
+  let body: {
+    keys?: unknown;
+    version?: unknown;
+  };
+
+  try {
+    body = await request.json();
+  } catch {
+    return addRateLimitHeaders(
+      new Response(JSON.stringify({ error: "Invalid JSON body" }), {
+        status: 400,
+        headers: { "Content-Type": "application/json" },
+      }),
+      rateLimitResult
+    );
+  }
+
+  const keys = body.keys;
+  if (
+    !Array.isArray(keys) ||
+    keys.length === 0 ||
+    !keys.every((key) => typeof key === "string" && key.length > 0)
+  ) {
+    return addRateLimitHeaders(
+      new Response(
+        JSON.stringify({ error: "keys must be a non-empty array of strings" }),
+        {
+          status: 400,
+          headers: { "Content-Type": "application/json" },
+        }
+      ),
+      rateLimitResult
+    );
+  }
+
+  const version = body.version;
+  if (
+    version !== undefined &&
+    (typeof version !== "number" || !Number.isInteger(version) || version < 1)
+  ) {
+    return addRateLimitHeaders(
+      new Response(
+        JSON.stringify({ error: "version must be a positive integer" }),
+        {
+          status: 400,
+          headers: { "Content-Type": "application/json" },
+        }
+      ),
+      rateLimitResult
+    );
+  }
+
+  if (keys.length > MAX_BATCH_KEYS) {
+    return addRateLimitHeaders(
+      new Response(
+        JSON.stringify({
+          error: `A batch may contain at most ${MAX_BATCH_KEYS} keys`,
+        }),
+        {
+          status: 400,
+          headers: { "Content-Type": "application/json" },
+        }
+      ),
+      rateLimitResult
+    );
+  }
+
+  try {
+    // Get project from API key
+    const project = await ctx.runQuery(
+      internal.domains.cliAuth.queries.getProjectByApiKey,
+      { apiKey }
+    );
+
+    if (!project) {
+      return addRateLimitHeaders(
+        new Response(
+          JSON.stringify({ error: "Invalid API key" }),
+          {
+            status: 401,
+            headers: { "Content-Type": "application/json" },
+          }
+        ),
+        rateLimitResult
+      );
+    }
+
+    const promptsWithVersions = await ctx.runQuery(
+      internal.domains.promptOrchestrator.queries.getByKeysInternal,
+      {
+        projectId: project.projectId as Id<"projects">,
+        keys: [...new Set(keys as string[])],
+        version,
+      }
+    );
+
+    // Prompts without the requested (or an active) version are omitted
+    const prompts: Record<string, unknown> = {};
+    for (const prompt of promptsWithVersions) {
+      if (!prompt.version) continue;
+
+      prompts[prompt.key] = {
+        key: prompt.key,
+        name: prompt.name,
+        description: prompt.description,
+        versionNumber: prompt.version.versionNumber,
+        systemPrompt: prompt.version.systemPrompt,
+        updatedAt: prompt.version.updatedAt,
+        // Additional metadata
+        purpose: prompt.purpose,
+        expectedBehavior: prompt.expectedBehavior,
+        inputFormat: prompt.inputFormat,
+        outputFormat: prompt.outputFormat,
+        constraints: prompt.constraints,
+        useCases: prompt.useCases,
+        additionalNotes: prompt.additionalNotes,
+        toolsNotes: prompt.toolsNotes,
+      };
+    }
+
+    return addRateLimitHeaders(
+      new Response(JSON.stringify({ prompts }), {
+        status: 200,
+        headers: {
+          "Content-Type": "application/json",
+          "Cache-Control": "no-cache",
+        },
+      }),
+      rateLimitResult
+    );
+  } catch (error) {
+    console.error("Error fetching prompts batch:", error);
+    return addRateLimitHeaders(
+      new Response(
+        JSON.stringify({ error: "Internal server error" }),
+        {
+          status: 500,
+          headers: { "Content-Type": "application/json" },
+        }
+      ),
+      rateLimitResult
+    );
+  }
+});
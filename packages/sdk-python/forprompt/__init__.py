@@ -46,7 +46,7 @@ Logging example:
 from .client import ForPrompt, AsyncForPrompt
 from .logger import ForPromptLogger, AsyncForPromptLogger
 from .types import Prompt, ForPromptError, ErrorCode
-from .pii import redact_pii, contains_pii, get_available_patterns
+from .pii import redact_pii, redact_pii_fast, contains_pii, get_available_patterns
 
 __version__ = "0.1.0"
 __all__ = [
@@ -62,6 +62,7 @@ __all__ = [
     "ErrorCode",
     # PII utilities
     "redact_pii",
+    "redact_pii_fast",
     "contains_pii",
     "get_available_patterns",
 ]
@@ -0,0 +1,31 @@
+"""
+JSON encoding helpers
+
+Uses orjson when it is installed and falls back to the standard library.
+Both functions work on bytes so payloads can be handed to httpx as-is.
+"""
+
+from typing import Any
+
+try:
+    import orjson
+
+    def loads(data: bytes) -> Any:
+        """Parse a JSON document."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize an object to compact JSON bytes."""
+        # Accept non-string dict keys like the stdlib encoder does
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+except ImportError:
+    import json
+
+    def loads(data: bytes) -> Any:
+        """Parse a JSON document."""
+        return json.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize an object to compact JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
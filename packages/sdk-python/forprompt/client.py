@@ -12,11 +12,23 @@ Example:
 
 import os
 import time
+import random
 import asyncio
-from typing import Optional, Dict, List, Any
+import threading
+from collections import deque
+from dataclasses import replace
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Optional, Dict, List, Any, Set, Tuple, Type
+from types import TracebackType
 
 import httpx
 
+try:
+    import h2  # noqa: F401  (enables HTTP/2 support in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 from .types import (
     Prompt,
     GetPromptOptions,
@@ -25,22 +37,217 @@ from .types import (
     ErrorCode,
 )
 from .pii import redact_pii, PIIRedactionConfig
+from . import _json
 
 
 DEFAULT_BASE_URL = "https://forprompt.dev"
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_RETRIES = 3
+DEFAULT_CACHE_TTL = 300.0
+
+# Retry backoff bounds, in seconds
+BASE_BACKOFF_DELAY = 1.0
+MAX_BACKOFF_DELAY = 30.0
+
+# Number of recent request outcomes used to scale backoff delays
+ADAPTIVE_BACKOFF_WINDOW = 32
+
+# Outcomes needed before the failure rate starts scaling delays
+ADAPTIVE_BACKOFF_MIN_SAMPLES = ADAPTIVE_BACKOFF_WINDOW // 4
+
+PROMPTS_PATH = "/api/prompts"
+PROMPTS_BATCH_PATH = "/api/prompts/batch"
+
+# Maximum number of keys per batch request (matches the server limit)
+MAX_BATCH_SIZE = 100
+
+# Request batching for AsyncForPrompt(enable_batching=True): lookups are
+# grouped until this many are queued or this many seconds have passed
+BATCHER_MAX_SIZE = 32
+BATCHER_MAX_WAIT = 0.010
+
+# Maximum number of worker threads used by ForPrompt.get_prompts
+CONCURRENCY_LIMIT = 5
 
+# Connection pool limits shared by the persistent HTTP clients. These also
+# bound how many requests AsyncForPrompt.get_prompts has on the wire at once.
+DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=20,
+    keepalive_expiry=60,
+)
+
+# Response statuses worth retrying, with the error code raised if retries run out
+RETRYABLE_STATUS_CODES: Dict[int, ErrorCode] = {
+    408: ErrorCode.TIMEOUT,
+    429: ErrorCode.RATE_LIMITED,
+    500: ErrorCode.SERVER_ERROR,
+    502: ErrorCode.SERVER_ERROR,
+    503: ErrorCode.SERVER_ERROR,
+    504: ErrorCode.SERVER_ERROR,
+}
+
+# Error codes for non-retryable statuses; anything else is API_ERROR
+STATUS_ERROR_CODES: Dict[int, ErrorCode] = {
+    404: ErrorCode.PROMPT_NOT_FOUND,
+}
+
+# Methods that are safe to replay after a connection drops mid-request
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def _get_backoff_delay(
+    prev_delay: float,
+    cap: float = MAX_BACKOFF_DELAY,
+    base: float = BASE_BACKOFF_DELAY,
+) -> float:
+    """Calculate the next backoff delay using decorrelated jitter."""
+    return min(cap, random.uniform(base, prev_delay * 3))
+
+
+def _parse_retry_after(
+    response: httpx.Response,
+    cap: float = MAX_BACKOFF_DELAY,
+) -> Optional[float]:
+    """Read a numeric Retry-After header, in seconds, bounded by cap."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return min(cap, max(0.0, float(value)))
+    except ValueError:
+        # HTTP-date form is not supported; fall back to computed backoff
+        return None
+
+
+# Queued batcher lookup: (key, version, future resolved with the prompt)
+_BatchItem = Tuple[str, Optional[int], "asyncio.Future[Prompt]"]
+
+
+def _validate_prompt_args(key: str, version: Optional[int]) -> None:
+    """Validate get_prompt arguments."""
+    if not key or not isinstance(key, str):
+        raise ForPromptError(
+            "Prompt key must be a non-empty string",
+            400,
+            ErrorCode.INVALID_INPUT
+        )
+
+    if len(key) > 256:
+        raise ForPromptError(
+            "Prompt key must be 256 characters or less",
+            400,
+            ErrorCode.INVALID_INPUT
+        )
+
+    if version is not None:
+        if not isinstance(version, int) or version < 1:
+            raise ForPromptError(
+                "Version must be a positive integer",
+                400,
+                ErrorCode.INVALID_INPUT
+            )
 
-def _get_backoff_delay(attempt: int) -> float:
-    """Calculate exponential backoff delay with jitter."""
-    import random
-    base_delay = (2 ** attempt)  # 1s, 2s, 4s, ...
-    jitter = random.random() * 0.5  # 0-0.5s random jitter
-    return min(base_delay + jitter, 30.0)  # Max 30s
 
+class _ClientBase:
+    """
+    Configuration, prompt cache and adaptive backoff state shared by
+    ForPrompt and AsyncForPrompt.
 
-class ForPrompt:
+    Subclasses add the HTTP client and the sync or async request path.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str],
+        base_url: Optional[str],
+        timeout: float,
+        retries: int,
+        redact_pii: bool,
+        cache_ttl: float,
+        adaptive_backoff: bool,
+    ):
+        self.api_key = api_key or os.environ.get("FORPROMPT_API_KEY", "")
+        self.base_url = (
+            base_url or os.environ.get("FORPROMPT_BASE_URL", DEFAULT_BASE_URL)
+        ).rstrip("/")
+        self.timeout = timeout
+        self.retries = retries
+        self.redact_pii_enabled = redact_pii
+
+        # In-process prompt cache: (key, version) -> (fetched_at, prompt)
+        self._cache: Dict[Tuple[str, Optional[int]], Tuple[float, Prompt]] = {}
+        self._cache_ttl = cache_ttl
+        self._cache_lock = threading.Lock()
+
+        # Cleared if the server doesn't offer the batch endpoint
+        self._batch_supported = True
+
+        # Outcomes of recent request attempts (True = server healthy)
+        self._adaptive_backoff = adaptive_backoff
+        self._recent: "deque[bool]" = deque(maxlen=ADAPTIVE_BACKOFF_WINDOW)
+
+        if not self.api_key:
+            raise ForPromptError(
+                "API key is required. Set FORPROMPT_API_KEY environment variable "
+                "or pass api_key parameter.",
+                401,
+                ErrorCode.MISSING_API_KEY
+            )
+
+    def invalidate(self, key: str, version: Optional[int] = None) -> None:
+        """
+        Drop cached entries for a prompt.
+
+        Args:
+            key: The prompt key
+            version: Specific version to drop. If omitted, all cached versions
+                of the key are dropped.
+        """
+        with self._cache_lock:
+            if version is not None:
+                self._cache.pop((key, version), None)
+            else:
+                for cache_key in [ck for ck in self._cache if ck[0] == key]:
+                    del self._cache[cache_key]
+
+    def clear_cache(self) -> None:
+        """Drop all cached prompts."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _get_cached(self, key: str, version: Optional[int]) -> Optional[Prompt]:
+        """Return a cached prompt, or None if absent or expired."""
+        if self._cache_ttl <= 0:
+            return None
+        with self._cache_lock:
+            cached = self._cache.get((key, version))
+        if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+        return None
+
+    def _store_cached(self, key: str, version: Optional[int], prompt: Prompt) -> None:
+        """Store a freshly fetched prompt in the cache."""
+        if self._cache_ttl > 0:
+            with self._cache_lock:
+                self._cache[(key, version)] = (time.monotonic(), prompt)
+
+    def _record_outcomes(self, outcomes: List[bool]) -> None:
+        """Record the attempt outcomes of a finished request."""
+        if self._adaptive_backoff:
+            self._recent.extend(outcomes)
+
+    def _scale_delay(self, delay: float) -> float:
+        """Stretch a backoff delay by up to 5x as the recent failure rate rises."""
+        total = len(self._recent)
+        # Too few samples to tell an outage from one unlucky request
+        if total < ADAPTIVE_BACKOFF_MIN_SAMPLES:
+            return delay
+        failure_rate = self._recent.count(False) / total
+        return min(MAX_BACKOFF_DELAY, delay * (1 + 4 * failure_rate))
+
+
+class ForPrompt(_ClientBase):
     """
     Synchronous ForPrompt client.
 
@@ -50,6 +257,9 @@ class ForPrompt:
         timeout: Request timeout in seconds. Default: 30.0
         retries: Number of retry attempts for failed requests. Default: 3
         redact_pii: Enable PII redaction in logging. Default: True
+        cache_ttl: Seconds to cache fetched prompts in memory. 0 disables. Default: 300
+        adaptive_backoff: Back off longer while many recent requests are failing.
+            Default: True
 
     Example:
         >>> client = ForPrompt(api_key="fp_proj_xxx")
@@ -69,106 +279,237 @@ class ForPrompt:
         timeout: float = DEFAULT_TIMEOUT,
         retries: int = DEFAULT_RETRIES,
         redact_pii: bool = True,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        adaptive_backoff: bool = True,
     ):
-        self.api_key = api_key or os.environ.get("FORPROMPT_API_KEY", "")
-        self.base_url = (
-            base_url or os.environ.get("FORPROMPT_BASE_URL", DEFAULT_BASE_URL)
-        ).rstrip("/")
-        self.timeout = timeout
-        self.retries = retries
-        self.redact_pii_enabled = redact_pii
+        super().__init__(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            retries=retries,
+            redact_pii=redact_pii,
+            cache_ttl=cache_ttl,
+            adaptive_backoff=adaptive_backoff,
+        )
 
-        if not self.api_key:
-            raise ForPromptError(
-                "API key is required. Set FORPROMPT_API_KEY environment variable "
-                "or pass api_key parameter.",
-                401,
-                ErrorCode.MISSING_API_KEY
-            )
+        # Requests currently on the wire, shared by concurrent callers
+        self._inflight: Dict[Tuple[str, Optional[int]], "Future[Prompt]"] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Worker pool for get_prompts, created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+        # Persistent client so repeated calls reuse pooled connections
+        self._client = self._new_client()
+        self._pid = os.getpid()
+
+    def _new_client(self) -> httpx.Client:
+        """Build the pooled HTTP client."""
+        return httpx.Client(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            headers={
+                "Content-Type": "application/json",
+                "X-API-Key": self.api_key,
+            },
+            # Set on the client rather than a custom transport so that
+            # HTTP(S)_PROXY and NO_PROXY from the environment still apply
+            limits=DEFAULT_LIMITS,
+        )
+
+    def _check_fork(self) -> None:
+        """Drop state inherited from the parent process after os.fork()."""
+        if self._pid == os.getpid():
+            return
+        # Pooled sockets would be shared with the parent, and the parent's
+        # worker threads and in-flight requests don't exist in this process
+        self._pid = os.getpid()
+        self._cache_lock = threading.Lock()
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._client = self._new_client()
+
+    def close(self) -> None:
+        """Close the underlying HTTP client and release pooled connections."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self._client.close()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the shared get_prompts worker pool, creating it if needed."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=CONCURRENCY_LIMIT,
+                    thread_name_prefix="forprompt",
+                )
+            return self._executor
+
+    def __enter__(self) -> "ForPrompt":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
 
     def _make_request(
         self,
         method: str,
         path: str,
         params: Optional[Dict[str, str]] = None,
-        json: Optional[Dict[str, Any]] = None
+        json: Optional[Dict[str, Any]] = None,
+        idempotent: Optional[bool] = None
     ) -> Dict[str, Any]:
-        """Make an HTTP request with retry and timeout."""
-        url = f"{self.base_url}{path}"
-        headers = {
-            "Content-Type": "application/json",
-            "X-API-Key": self.api_key,
-        }
+        """
+        Make an HTTP request with retry and timeout.
 
+        ``idempotent`` marks a request as safe to replay after a dropped
+        connection; by default this follows the HTTP method.
+        """
         last_error: Optional[Exception] = None
-
-        for attempt in range(self.retries):
-            try:
-                with httpx.Client(timeout=self.timeout) as client:
-                    response = client.request(
+        delay = BASE_BACKOFF_DELAY
+        body = _json.dumps(json) if json is not None else None
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        # Recorded once the request finishes, so its own failed attempts
+        # don't stretch its own retry delays
+        outcomes: List[bool] = []
+
+        try:
+            for attempt in range(self.retries):
+                retry_after: Optional[float] = None
+                try:
+                    response = self._client.request(
                         method=method,
-                        url=url,
-                        headers=headers,
+                        url=path,
                         params=params,
-                        json=json,
+                        content=body,
                     )
+                    status = response.status_code
 
-                    # Don't retry client errors (4xx)
-                    if 400 <= response.status_code < 500:
+                    # Success
+                    if 200 <= status < 300:
+                        outcomes.append(True)
+                        return _json.loads(response.content)
+
+                    # Transient failure - will retry, honoring any Retry-After hint
+                    if status in RETRYABLE_STATUS_CODES:
+                        outcomes.append(False)
+                        retry_after = _parse_retry_after(response)
+                        last_error = ForPromptError(
+                            f"HTTP {status}",
+                            status,
+                            RETRYABLE_STATUS_CODES[status]
+                        )
+
+                    # Don't retry other errors
+                    else:
+                        outcomes.append(True)
                         try:
-                            error_data = response.json()
+                            error_data = _json.loads(response.content)
                         except Exception:
                             error_data = {"error": "Unknown error"}
 
                         raise ForPromptError(
-                            error_data.get("error", f"HTTP {response.status_code}"),
-                            response.status_code,
-                            ErrorCode.PROMPT_NOT_FOUND if response.status_code == 404
-                            else ErrorCode.API_ERROR
+                            error_data.get("error", f"HTTP {status}"),
+                            status,
+                            STATUS_ERROR_CODES.get(status, ErrorCode.API_ERROR)
                         )
 
-                    # Success
-                    if response.is_success:
-                        return response.json()
+                except httpx.TimeoutException:
+                    outcomes.append(False)
+                    last_error = ForPromptError(
+                        f"Request timeout after {self.timeout}s",
+                        408,
+                        ErrorCode.TIMEOUT
+                    )
+                    # Don't retry timeout errors
+                    raise last_error
 
-                    # Server error (5xx) - will retry
+                except httpx.ConnectError as e:
+                    outcomes.append(False)
+                    # Nothing reached the server, so any method can be retried
                     last_error = ForPromptError(
-                        f"Server error: {response.status_code}",
-                        response.status_code,
-                        ErrorCode.SERVER_ERROR
+                        str(e),
+                        0,
+                        ErrorCode.NETWORK_ERROR
                     )
 
-            except httpx.TimeoutException:
-                last_error = ForPromptError(
-                    f"Request timeout after {self.timeout}s",
-                    408,
-                    ErrorCode.TIMEOUT
-                )
-                # Don't retry timeout errors
-                raise last_error
-
-            except httpx.RequestError as e:
-                last_error = ForPromptError(
-                    str(e),
-                    0,
-                    ErrorCode.NETWORK_ERROR
-                )
+                except httpx.RequestError as e:
+                    outcomes.append(False)
+                    last_error = ForPromptError(
+                        str(e),
+                        0,
+                        ErrorCode.NETWORK_ERROR
+                    )
+                    # Only replay requests that are safe to send twice
+                    if not idempotent:
+                        raise last_error
 
-            except ForPromptError:
-                # Re-raise ForPromptErrors (client errors)
-                raise
-
-            # Wait before retrying (unless this is the last attempt)
-            if attempt < self.retries - 1:
-                delay = _get_backoff_delay(attempt)
-                time.sleep(delay)
-
-        raise last_error or ForPromptError(
-            "Request failed after retries",
-            500,
-            ErrorCode.RETRY_EXHAUSTED
+                except ForPromptError:
+                    # Re-raise ForPromptErrors (client errors)
+                    raise
+
+                # Wait before retrying (unless this is the last attempt)
+                if attempt < self.retries - 1:
+                    delay = _get_backoff_delay(delay)
+                    time.sleep(
+                        retry_after if retry_after is not None
+                        else self._scale_delay(delay)
+                    )
+
+            raise last_error or ForPromptError(
+                "Request failed after retries",
+                500,
+                ErrorCode.RETRY_EXHAUSTED
+            )
+        finally:
+            self._record_outcomes(outcomes)
+
+    def _fetch_prompt(self, key: str, version: Optional[int]) -> Prompt:
+        """Fetch a prompt from the API and store it in the cache."""
+        params: Dict[str, str] = (
+            {"key": key} if version is None
+            else {"key": key, "version": str(version)}
         )
 
+        data = self._make_request("GET", PROMPTS_PATH, params=params)
+        prompt = Prompt.from_dict(data)
+
+        self._store_cached(key, version, prompt)
+        return prompt
+
+    def _fetch_prompts_batch(
+        self,
+        keys: List[str],
+        version: Optional[int]
+    ) -> Dict[str, Prompt]:
+        """Fetch up to MAX_BATCH_SIZE prompts in one request and cache them."""
+        body: Dict[str, Any] = {"keys": keys}
+        if version is not None:
+            body["version"] = version
+
+        # Read-only despite being a POST, so safe to replay
+        data = self._make_request(
+            "POST", PROMPTS_BATCH_PATH, json=body, idempotent=True
+        )
+
+        result: Dict[str, Prompt] = {}
+        for key, item in data.get("prompts", {}).items():
+            prompt = Prompt.from_dict(item)
+            self._store_cached(key, version, prompt)
+            result[key] = prompt
+        return result
+
     def get_prompt(
         self,
         key: str,
@@ -194,35 +535,38 @@ class ForPrompt:
             # Get specific version
             >>> prompt = client.get_prompt("my-prompt", version=2)
         """
-        # Input validation
-        if not key or not isinstance(key, str):
-            raise ForPromptError(
-                "Prompt key must be a non-empty string",
-                400,
-                ErrorCode.INVALID_INPUT
-            )
-
-        if len(key) > 256:
-            raise ForPromptError(
-                "Prompt key must be 256 characters or less",
-                400,
-                ErrorCode.INVALID_INPUT
-            )
-
-        if version is not None:
-            if not isinstance(version, int) or version < 1:
-                raise ForPromptError(
-                    "Version must be a positive integer",
-                    400,
-                    ErrorCode.INVALID_INPUT
-                )
-
-        params: Dict[str, str] = {"key": key}
-        if version is not None:
-            params["version"] = str(version)
-
-        data = self._make_request("GET", "/api/prompts", params=params)
-        return Prompt.from_dict(data)
+        _validate_prompt_args(key, version)
+        self._check_fork()
+
+        cached = self._get_cached(key, version)
+        if cached is not None:
+            # Hand out a copy so callers can't mutate the shared cached prompt
+            return replace(cached)
+
+        cache_key = (key, version)
+
+        # Coalesce concurrent requests for the same prompt into one call
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            is_owner = future is None
+            if future is None:
+                future = Future()
+                self._inflight[cache_key] = future
+
+        if not is_owner:
+            return replace(future.result())
+
+        try:
+            prompt = self._fetch_prompt(key, version)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(prompt)
+            return replace(prompt)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(cache_key, None)
 
     def get_prompts(
         self,
@@ -232,7 +576,9 @@ class ForPrompt:
         """
         Get multiple prompts by their keys.
 
-        Requests are made with concurrency limit to avoid overwhelming the server.
+        Prompts are fetched in a single batch request. If the server doesn't
+        support batching, requests are made concurrently on a thread pool,
+        with a concurrency limit to avoid overwhelming the server.
 
         Args:
             keys: List of prompt keys to fetch
@@ -245,26 +591,225 @@ class ForPrompt:
             >>> prompts = client.get_prompts(["prompt-1", "prompt-2"])
             >>> print(prompts["prompt-1"].system_prompt)
         """
-        result: Dict[str, Prompt] = {}
+        self._check_fork()
+        fetched: Dict[str, Prompt] = {}
+        pending: Dict[str, None] = {}
 
-        # Limit concurrent requests
-        CONCURRENCY_LIMIT = 5
+        for key in keys:
+            try:
+                _validate_prompt_args(key, version)
+            except ForPromptError:
+                # Skip invalid keys
+                continue
+            cached = self._get_cached(key, version)
+            if cached is not None:
+                fetched[key] = cached
+            else:
+                pending[key] = None
+
+        remaining = list(pending)
+        if remaining and self._batch_supported:
+            batched = self._fetch_prompts_batched(remaining, version)
+            if batched is not None:
+                fetched.update(batched)
+                remaining = []
+
+        if remaining:
+            # Server predates the batch endpoint; fetch keys one by one
+            fetched.update(self._fetch_prompts_each(remaining, version))
+
+        # Preserve the caller's key order, copying prompts shared with the cache
+        return {key: replace(fetched[key]) for key in keys if key in fetched}
+
+    def _fetch_prompts_batched(
+        self,
+        keys: List[str],
+        version: Optional[int]
+    ) -> Optional[Dict[str, Prompt]]:
+        """
+        Fetch prompts in MAX_BATCH_SIZE chunks, sending chunks concurrently.
 
-        for i in range(0, len(keys), CONCURRENCY_LIMIT):
-            batch = keys[i:i + CONCURRENCY_LIMIT]
+        Returns None if the server doesn't support the batch endpoint.
+        """
+        chunks = [
+            keys[i:i + MAX_BATCH_SIZE]
+            for i in range(0, len(keys), MAX_BATCH_SIZE)
+        ]
+        executor = self._get_executor()
+        futures = [
+            executor.submit(self._fetch_prompts_batch, chunk, version)
+            for chunk in chunks
+        ]
+
+        fetched: Dict[str, Prompt] = {}
+        for future in futures:
+            try:
+                fetched.update(future.result())
+            except ForPromptError as e:
+                if e.status_code in (404, 405):
+                    self._batch_supported = False
+                    return None
+                # Skip failed prompts
+        return fetched
 
-            for key in batch:
-                try:
-                    prompt = self.get_prompt(key, version)
-                    result[key] = prompt
-                except ForPromptError:
-                    # Skip failed prompts
-                    pass
+    def _fetch_prompts_each(
+        self,
+        keys: List[str],
+        version: Optional[int]
+    ) -> Dict[str, Prompt]:
+        """Fetch prompts with one request per key, skipping failures."""
+        fetched: Dict[str, Prompt] = {}
 
-        return result
+        executor = self._get_executor()
+        futures = {
+            executor.submit(self.get_prompt, key, version): key
+            for key in keys
+        }
+        for future in as_completed(futures):
+            try:
+                fetched[futures[future]] = future.result()
+            except ForPromptError:
+                # Skip failed prompts
+                pass
+
+        return fetched
 
 
-class AsyncForPrompt:
+class _PromptBatcher:
+    """
+    Groups concurrent AsyncForPrompt lookups into batch requests.
+
+    Lookups queue for up to ``max_wait`` seconds (or until ``max_size`` are
+    queued) and are then sent in one request per version.
+    """
+
+    def __init__(
+        self,
+        client: "AsyncForPrompt",
+        max_size: int = BATCHER_MAX_SIZE,
+        max_wait: float = BATCHER_MAX_WAIT,
+    ):
+        self._client = client
+        self._max_size = max_size
+        self._max_wait = max_wait
+
+        # Created on first use so they bind to the running event loop
+        self._queue: Optional["asyncio.Queue[_BatchItem]"] = None
+        self._worker: Optional["asyncio.Task[None]"] = None
+        self._dispatches: Set["asyncio.Task[None]"] = set()
+        self._collecting = False
+
+    async def submit(self, key: str, version: Optional[int]) -> Prompt:
+        """Queue a lookup and wait for the batch containing it."""
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+        future: "asyncio.Future[Prompt]" = loop.create_future()
+        self._queue.put_nowait((key, version, future))
+        return await future
+
+    async def flush(self) -> None:
+        """Send queued lookups now and wait for every batch to finish."""
+        while True:
+            if self._queue is not None and not self._queue.empty():
+                self._dispatch(self._drain([]))
+            if self._dispatches:
+                await asyncio.gather(*self._dispatches, return_exceptions=True)
+            elif self._collecting:
+                await asyncio.sleep(self._max_wait)
+            else:
+                return
+
+    async def close(self) -> None:
+        """Flush pending lookups and stop the background worker."""
+        await self.flush()
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        while True:
+            items = [await self._queue.get()]
+            self._collecting = True
+            try:
+                if self._queue.qsize() < self._max_size - 1:
+                    await asyncio.sleep(self._max_wait)
+                self._dispatch(self._drain(items))
+            finally:
+                self._collecting = False
+
+    def _drain(self, items: List["_BatchItem"]) -> List["_BatchItem"]:
+        assert self._queue is not None
+        while len(items) < self._max_size and not self._queue.empty():
+            items.append(self._queue.get_nowait())
+        return items
+
+    def _dispatch(self, items: List["_BatchItem"]) -> None:
+        task = asyncio.ensure_future(self._send(items))
+        self._dispatches.add(task)
+        task.add_done_callback(self._dispatches.discard)
+
+    async def _send(self, items: List["_BatchItem"]) -> None:
+        by_version: Dict[Optional[int], List[_BatchItem]] = {}
+        for item in items:
+            by_version.setdefault(item[1], []).append(item)
+
+        for version, group in by_version.items():
+            keys = list(dict.fromkeys(key for key, _, _ in group))
+            try:
+                prompts = await self._client._fetch_prompts_batch(keys, version)
+            except ForPromptError as e:
+                if e.status_code in (404, 405):
+                    # Server predates the batch endpoint; fetch keys one by one
+                    self._client._batch_supported = False
+                    await asyncio.gather(
+                        *(self._resolve_directly(item) for item in group)
+                    )
+                else:
+                    for _, _, future in group:
+                        if not future.done():
+                            future.set_exception(e)
+                continue
+            except Exception as e:
+                for _, _, future in group:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for key, _, future in group:
+                if future.done():
+                    # Caller was cancelled while waiting
+                    continue
+                prompt = prompts.get(key)
+                if prompt is not None:
+                    future.set_result(prompt)
+                else:
+                    future.set_exception(ForPromptError(
+                        f'Prompt with key "{key}" not found',
+                        404,
+                        ErrorCode.PROMPT_NOT_FOUND
+                    ))
+
+    async def _resolve_directly(self, item: "_BatchItem") -> None:
+        key, version, future = item
+        try:
+            prompt = await self._client._fetch_prompt(key, version)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(prompt)
+
+
+class AsyncForPrompt(_ClientBase):
     """
     Asynchronous ForPrompt client.
 
@@ -274,6 +819,13 @@ class AsyncForPrompt:
         timeout: Request timeout in seconds. Default: 30.0
         retries: Number of retry attempts for failed requests. Default: 3
         redact_pii: Enable PII redaction in logging. Default: True
+        cache_ttl: Seconds to cache fetched prompts in memory. 0 disables. Default: 300
+        adaptive_backoff: Back off longer while many recent requests are failing.
+            Default: True
+        http2: Multiplex requests over HTTP/2 when the server supports it.
+            Requires the ``http2`` extra (``pip install forprompt[http2]``). Default: True
+        enable_batching: Group concurrent get_prompt calls into batch requests,
+            adding up to 10ms of latency per call. Default: False
 
     Example:
         >>> async def main():
@@ -289,106 +841,239 @@ class AsyncForPrompt:
         timeout: float = DEFAULT_TIMEOUT,
         retries: int = DEFAULT_RETRIES,
         redact_pii: bool = True,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        adaptive_backoff: bool = True,
+        http2: bool = True,
+        enable_batching: bool = False,
     ):
-        self.api_key = api_key or os.environ.get("FORPROMPT_API_KEY", "")
-        self.base_url = (
-            base_url or os.environ.get("FORPROMPT_BASE_URL", DEFAULT_BASE_URL)
-        ).rstrip("/")
-        self.timeout = timeout
-        self.retries = retries
-        self.redact_pii_enabled = redact_pii
+        super().__init__(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            retries=retries,
+            redact_pii=redact_pii,
+            cache_ttl=cache_ttl,
+            adaptive_backoff=adaptive_backoff,
+        )
 
-        if not self.api_key:
-            raise ForPromptError(
-                "API key is required. Set FORPROMPT_API_KEY environment variable "
-                "or pass api_key parameter.",
-                401,
-                ErrorCode.MISSING_API_KEY
-            )
+        # Requests currently on the wire, shared by concurrent callers
+        self._inflight: Dict[Tuple[str, Optional[int]], "asyncio.Task[Prompt]"] = {}
+
+        self._batcher: Optional[_PromptBatcher] = (
+            _PromptBatcher(self) if enable_batching else None
+        )
+
+        # Persistent client so repeated calls reuse pooled connections. Its
+        # connections belong to the event loop that first uses it.
+        self._http2 = http2 and HTTP2_AVAILABLE
+        self._client = self._new_client()
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _new_client(self) -> httpx.AsyncClient:
+        """Build the pooled HTTP client."""
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            # Requests queue for a pooled connection instead of timing out
+            timeout=httpx.Timeout(self.timeout, pool=None),
+            headers={
+                "Content-Type": "application/json",
+                "X-API-Key": self.api_key,
+            },
+            # Set on the client rather than a custom transport so that
+            # HTTP(S)_PROXY and NO_PROXY from the environment still apply
+            limits=DEFAULT_LIMITS,
+            # Falls back to HTTP/1.1 without h2 or if the server declines
+            http2=self._http2,
+        )
+
+    def _check_loop(self) -> None:
+        """
+        Drop state bound to an earlier event loop.
+
+        Pooled connections, in-flight tasks and the batcher queue belong to
+        the loop that created them, so a client reused from a new loop
+        (e.g. a second asyncio.run()) replaces them.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client_loop is loop:
+            return
+        if self._client_loop is not None:
+            self._client = self._new_client()
+            self._inflight = {}
+            if self._batcher is not None:
+                self._batcher = _PromptBatcher(self)
+        self._client_loop = loop
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and release pooled connections."""
+        self._check_loop()
+        if self._batcher is not None:
+            await self._batcher.close()
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncForPrompt":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
 
     async def _make_request(
         self,
         method: str,
         path: str,
         params: Optional[Dict[str, str]] = None,
-        json: Optional[Dict[str, Any]] = None
+        json: Optional[Dict[str, Any]] = None,
+        idempotent: Optional[bool] = None
     ) -> Dict[str, Any]:
-        """Make an async HTTP request with retry and timeout."""
-        url = f"{self.base_url}{path}"
-        headers = {
-            "Content-Type": "application/json",
-            "X-API-Key": self.api_key,
-        }
+        """
+        Make an async HTTP request with retry and timeout.
 
+        ``idempotent`` marks a request as safe to replay after a dropped
+        connection; by default this follows the HTTP method.
+        """
         last_error: Optional[Exception] = None
-
-        for attempt in range(self.retries):
-            try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.request(
+        delay = BASE_BACKOFF_DELAY
+        body = _json.dumps(json) if json is not None else None
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        # Recorded once the request finishes, so its own failed attempts
+        # don't stretch its own retry delays
+        outcomes: List[bool] = []
+
+        try:
+            for attempt in range(self.retries):
+                retry_after: Optional[float] = None
+                try:
+                    response = await self._client.request(
                         method=method,
-                        url=url,
-                        headers=headers,
+                        url=path,
                         params=params,
-                        json=json,
+                        content=body,
                     )
+                    status = response.status_code
 
-                    # Don't retry client errors (4xx)
-                    if 400 <= response.status_code < 500:
+                    # Success
+                    if 200 <= status < 300:
+                        outcomes.append(True)
+                        return _json.loads(response.content)
+
+                    # Transient failure - will retry, honoring any Retry-After hint
+                    if status in RETRYABLE_STATUS_CODES:
+                        outcomes.append(False)
+                        retry_after = _parse_retry_after(response)
+                        last_error = ForPromptError(
+                            f"HTTP {status}",
+                            status,
+                            RETRYABLE_STATUS_CODES[status]
+                        )
+
+                    # Don't retry other errors
+                    else:
+                        outcomes.append(True)
                         try:
-                            error_data = response.json()
+                            error_data = _json.loads(response.content)
                         except Exception:
                             error_data = {"error": "Unknown error"}
 
                         raise ForPromptError(
-                            error_data.get("error", f"HTTP {response.status_code}"),
-                            response.status_code,
-                            ErrorCode.PROMPT_NOT_FOUND if response.status_code == 404
-                            else ErrorCode.API_ERROR
+                            error_data.get("error", f"HTTP {status}"),
+                            status,
+                            STATUS_ERROR_CODES.get(status, ErrorCode.API_ERROR)
                         )
 
-                    # Success
-                    if response.is_success:
-                        return response.json()
+                except httpx.TimeoutException:
+                    outcomes.append(False)
+                    last_error = ForPromptError(
+                        f"Request timeout after {self.timeout}s",
+                        408,
+                        ErrorCode.TIMEOUT
+                    )
+                    # Don't retry timeout errors
+                    raise last_error
 
-                    # Server error (5xx) - will retry
+                except httpx.ConnectError as e:
+                    outcomes.append(False)
+                    # Nothing reached the server, so any method can be retried
                     last_error = ForPromptError(
-                        f"Server error: {response.status_code}",
-                        response.status_code,
-                        ErrorCode.SERVER_ERROR
+                        str(e),
+                        0,
+                        ErrorCode.NETWORK_ERROR
                     )
 
-            except httpx.TimeoutException:
-                last_error = ForPromptError(
-                    f"Request timeout after {self.timeout}s",
-                    408,
-                    ErrorCode.TIMEOUT
-                )
-                # Don't retry timeout errors
-                raise last_error
-
-            except httpx.RequestError as e:
-                last_error = ForPromptError(
-                    str(e),
-                    0,
-                    ErrorCode.NETWORK_ERROR
-                )
+                except httpx.RequestError as e:
+                    outcomes.append(False)
+                    last_error = ForPromptError(
+                        str(e),
+                        0,
+                        ErrorCode.NETWORK_ERROR
+                    )
+                    # Only replay requests that are safe to send twice
+                    if not idempotent:
+                        raise last_error
 
-            except ForPromptError:
-                # Re-raise ForPromptErrors (client errors)
-                raise
-
-            # Wait before retrying (unless this is the last attempt)
-            if attempt < self.retries - 1:
-                delay = _get_backoff_delay(attempt)
-                await asyncio.sleep(delay)
-
-        raise last_error or ForPromptError(
-            "Request failed after retries",
-            500,
-            ErrorCode.RETRY_EXHAUSTED
+                except ForPromptError:
+                    # Re-raise ForPromptErrors (client errors)
+                    raise
+
+                # Wait before retrying (unless this is the last attempt)
+                if attempt < self.retries - 1:
+                    delay = _get_backoff_delay(delay)
+                    await asyncio.sleep(
+                        retry_after if retry_after is not None
+                        else self._scale_delay(delay)
+                    )
+
+            raise last_error or ForPromptError(
+                "Request failed after retries",
+                500,
+                ErrorCode.RETRY_EXHAUSTED
+            )
+        finally:
+            self._record_outcomes(outcomes)
+
+    async def _fetch_prompt(self, key: str, version: Optional[int]) -> Prompt:
+        """Fetch a prompt from the API and store it in the cache."""
+        if self._batcher is not None and self._batch_supported:
+            return await self._batcher.submit(key, version)
+
+        params: Dict[str, str] = (
+            {"key": key} if version is None
+            else {"key": key, "version": str(version)}
+        )
+
+        data = await self._make_request("GET", PROMPTS_PATH, params=params)
+        prompt = Prompt.from_dict(data)
+
+        self._store_cached(key, version, prompt)
+        return prompt
+
+    async def _fetch_prompts_batch(
+        self,
+        keys: List[str],
+        version: Optional[int]
+    ) -> Dict[str, Prompt]:
+        """Fetch up to MAX_BATCH_SIZE prompts in one request and cache them."""
+        body: Dict[str, Any] = {"keys": keys}
+        if version is not None:
+            body["version"] = version
+
+        # Read-only despite being a POST, so safe to replay
+        data = await self._make_request(
+            "POST", PROMPTS_BATCH_PATH, json=body, idempotent=True
         )
 
+        result: Dict[str, Prompt] = {}
+        for key, item in data.get("prompts", {}).items():
+            prompt = Prompt.from_dict(item)
+            self._store_cached(key, version, prompt)
+            result[key] = prompt
+        return result
+
     async def get_prompt(
         self,
         key: str,
@@ -407,35 +1092,32 @@ class AsyncForPrompt:
         Raises:
             ForPromptError: If the request fails
         """
-        # Input validation
-        if not key or not isinstance(key, str):
-            raise ForPromptError(
-                "Prompt key must be a non-empty string",
-                400,
-                ErrorCode.INVALID_INPUT
-            )
+        _validate_prompt_args(key, version)
+        self._check_loop()
 
-        if len(key) > 256:
-            raise ForPromptError(
-                "Prompt key must be 256 characters or less",
-                400,
-                ErrorCode.INVALID_INPUT
-            )
+        cached = self._get_cached(key, version)
+        if cached is not None:
+            # Hand out a copy so callers can't mutate the shared cached prompt
+            return replace(cached)
 
-        if version is not None:
-            if not isinstance(version, int) or version < 1:
-                raise ForPromptError(
-                    "Version must be a positive integer",
-                    400,
-                    ErrorCode.INVALID_INPUT
-                )
+        cache_key = (key, version)
 
-        params: Dict[str, str] = {"key": key}
-        if version is not None:
-            params["version"] = str(version)
+        # Coalesce concurrent requests for the same prompt into one task
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_prompt(key, version))
+            self._inflight[cache_key] = task
+
+            def _on_done(done: "asyncio.Task[Prompt]") -> None:
+                self._inflight.pop(cache_key, None)
+                # Mark the exception retrieved even if every waiter was cancelled
+                if not done.cancelled():
+                    done.exception()
+
+            task.add_done_callback(_on_done)
 
-        data = await self._make_request("GET", "/api/prompts", params=params)
-        return Prompt.from_dict(data)
+        # Shield so one cancelled caller doesn't cancel the others
+        return replace(await asyncio.shield(task))
 
     async def get_prompts(
         self,
@@ -445,7 +1127,9 @@ class AsyncForPrompt:
         """
         Get multiple prompts by their keys.
 
-        Requests are made concurrently with a concurrency limit.
+        Prompts are fetched in a single batch request. If the server doesn't
+        support batching, requests are made concurrently; the client's
+        connection pool limits how many are in flight at once.
 
         Args:
             keys: List of prompt keys to fetch
@@ -454,24 +1138,86 @@ class AsyncForPrompt:
         Returns:
             Dictionary mapping keys to Prompt objects (missing prompts omitted)
         """
-        result: Dict[str, Prompt] = {}
+        self._check_loop()
+        fetched: Dict[str, Prompt] = {}
+        pending: Dict[str, None] = {}
 
-        # Limit concurrent requests
-        CONCURRENCY_LIMIT = 5
-        semaphore = asyncio.Semaphore(CONCURRENCY_LIMIT)
+        for key in keys:
+            try:
+                _validate_prompt_args(key, version)
+            except ForPromptError:
+                # Skip invalid keys
+                continue
+            cached = self._get_cached(key, version)
+            if cached is not None:
+                fetched[key] = cached
+            else:
+                pending[key] = None
+
+        remaining = list(pending)
+        if remaining and self._batch_supported:
+            batched = await self._fetch_prompts_batched(remaining, version)
+            if batched is not None:
+                fetched.update(batched)
+                remaining = []
+
+        if remaining:
+            # Server predates the batch endpoint; fetch keys one by one
+            fetched.update(await self._fetch_prompts_each(remaining, version))
+
+        # Preserve the caller's key order, copying prompts shared with the cache
+        return {key: replace(fetched[key]) for key in keys if key in fetched}
+
+    async def _fetch_prompts_batched(
+        self,
+        keys: List[str],
+        version: Optional[int]
+    ) -> Optional[Dict[str, Prompt]]:
+        """
+        Fetch prompts in MAX_BATCH_SIZE chunks, sending chunks concurrently.
 
-        async def fetch_one(key: str) -> Optional[Prompt]:
-            async with semaphore:
-                try:
-                    return await self.get_prompt(key, version)
-                except ForPromptError:
+        Returns None if the server doesn't support the batch endpoint.
+        """
+        chunks = [
+            keys[i:i + MAX_BATCH_SIZE]
+            for i in range(0, len(keys), MAX_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(self._fetch_prompts_batch(chunk, version) for chunk in chunks),
+            return_exceptions=True,
+        )
+
+        fetched: Dict[str, Prompt] = {}
+        for result in results:
+            if isinstance(result, ForPromptError):
+                if result.status_code in (404, 405):
+                    self._batch_supported = False
                     return None
+                # Skip failed prompts
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            fetched.update(result)
+        return fetched
+
+    async def _fetch_prompts_each(
+        self,
+        keys: List[str],
+        version: Optional[int]
+    ) -> Dict[str, Prompt]:
+        """Fetch prompts with one request per key, skipping failures."""
+        fetched: Dict[str, Prompt] = {}
 
-        tasks = [fetch_one(key) for key in keys]
-        results = await asyncio.gather(*tasks)
+        async def fetch_one(key: str) -> Tuple[str, Optional[Prompt]]:
+            try:
+                return key, await self.get_prompt(key, version)
+            except ForPromptError:
+                return key, None
 
-        for key, prompt in zip(keys, results):
+        # Collect each response as soon as it lands
+        for completed in asyncio.as_completed([fetch_one(key) for key in keys]):
+            key, prompt = await completed
             if prompt is not None:
-                result[key] = prompt
+                fetched[key] = prompt
 
-        return result
+        return fetched
@@ -6,8 +6,14 @@ Supports automatic PII redaction for user privacy.
 """
 
 import os
-import uuid
-from typing import Optional, Dict, Any
+import time
+import queue
+import atexit
+import asyncio
+import logging
+import threading
+from types import TracebackType
+from typing import Optional, Dict, Any, List, Type
 
 import httpx
 
@@ -15,46 +21,156 @@ from .types import (
     ForPromptError,
     ErrorCode,
     LogOptions,
-    PIIRedactionConfig,
 )
-from .pii import redact_pii
+from .pii import redact_pii_fast, describe_redactions
+from .client import HTTP2_AVAILABLE
+from . import _json
 
 
 DEFAULT_BASE_URL = "https://forprompt.dev"
 DEFAULT_TIMEOUT = 30.0
 
+LOG_PATH = "/api/log"
+LOG_BATCH_PATH = "/api/log/batch"
 
-class ForPromptLogger:
+# Connection pool defaults. Bursts of concurrent logs from a threaded
+# server can open more connections than the prompt client needs.
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+# Background delivery defaults (enable_batching=True)
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_FLUSH_INTERVAL = 0.05
+DEFAULT_MAX_QUEUE_SIZE = 10_000
+
+# Largest batch the /api/log/batch endpoint accepts (MAX_BATCH_EVENTS)
+MAX_BATCH_SIZE = 100
+
+# Tells the sync worker thread to exit
+_STOP = object()
+
+# Random bytes are read in blocks and sliced into trace IDs
+TRACE_ID_BUFFER_SIZE = 4096
+
+_log = logging.getLogger(__name__)
+
+
+_trace_id_lock = threading.Lock()
+_trace_id_buffer = b""
+_trace_id_offset = 0
+
+
+def _reset_trace_id_buffer() -> None:
     """
-    Logger for tracking conversations and interactions with ForPrompt.
+    Discard buffered randomness so a forked child never reuses it.
 
-    Supports:
-    - Trace-based conversation logging
-    - Automatic PII redaction
-    - Single request logging
+    The lock is replaced too, since a fork while another thread held it
+    would leave it locked forever in the child.
+    """
+    global _trace_id_lock, _trace_id_buffer, _trace_id_offset
+    _trace_id_lock = threading.Lock()
+    _trace_id_buffer = b""
+    _trace_id_offset = 0
 
-    Args:
-        api_key: Project API key
-        base_url: Base URL for the API
-        source: Source identifier (e.g., "python-sdk", "my-app")
-        redact_pii: Enable PII redaction (default: True)
-        timeout: Request timeout in seconds
 
-    Example:
-        >>> logger = ForPromptLogger(api_key="fp_proj_xxx")
-        >>> trace_id = logger.start_trace("my-prompt")
-        >>> logger.log(role="user", content="Hello!")
-        >>> logger.log(role="assistant", content="Hi there!")
-        >>> logger.end_trace()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_trace_id_buffer)
+
+
+def _new_trace_id() -> str:
+    """
+    Generate a random (version 4) UUID string for a trace.
+
+    Equivalent to str(uuid.uuid4()) but reads os.urandom in blocks
+    instead of once per ID.
+    """
+    global _trace_id_buffer, _trace_id_offset
+    with _trace_id_lock:
+        if _trace_id_offset + 16 > len(_trace_id_buffer):
+            _trace_id_buffer = os.urandom(TRACE_ID_BUFFER_SIZE)
+            _trace_id_offset = 0
+        raw = bytearray(
+            _trace_id_buffer[_trace_id_offset:_trace_id_offset + 16]
+        )
+        _trace_id_offset += 16
+
+    # Set the version (4) and RFC 4122 variant bits
+    raw[6] = (raw[6] & 0x0F) | 0x40
+    raw[8] = (raw[8] & 0x3F) | 0x80
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _build_payload(
+    trace_id: str,
+    prompt_key: Optional[str],
+    version_number: Optional[int],
+    role: str,
+    content: str,
+    source: str,
+    model: Optional[str] = None,
+    input_tokens: Optional[int] = None,
+    output_tokens: Optional[int] = None,
+    duration_ms: Optional[int] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Build a log event, omitting unset fields rather than sending nulls.
+
+    Metadata is sent as a JSON string, which is what the server stores.
+    """
+    payload: Dict[str, Any] = {
+        "traceId": trace_id,
+        "promptKey": prompt_key or "unknown",
+        "type": "message",
+        "role": role,
+        "content": content,
+        "source": source,
+    }
+    if version_number is not None:
+        payload["versionNumber"] = version_number
+    if model is not None:
+        payload["model"] = model
+    if input_tokens is not None:
+        payload["inputTokens"] = input_tokens
+    if output_tokens is not None:
+        payload["outputTokens"] = output_tokens
+    if duration_ms is not None:
+        payload["durationMs"] = duration_ms
+    if metadata is not None:
+        payload["metadata"] = _json.dumps(metadata).decode("utf-8")
+    return payload
+
+
+def _encode_batch(events: List[bytes]) -> bytes:
+    """Wrap already-encoded events in a batch request body."""
+    return b'{"events":[' + b",".join(events) + b"]}"
+
+
+class _LoggerBase:
+    """
+    Trace state, payload preparation and response handling shared by
+    ForPromptLogger and AsyncForPromptLogger.
+
+    Subclasses add the HTTP client and the sync or async delivery path.
     """
 
     def __init__(
         self,
-        api_key: Optional[str] = None,
-        base_url: Optional[str] = None,
-        source: str = "python-sdk",
-        redact_pii: bool = True,
-        timeout: float = DEFAULT_TIMEOUT,
+        api_key: Optional[str],
+        base_url: Optional[str],
+        source: str,
+        redact_pii: bool,
+        timeout: float,
+        enable_batching: bool,
+        batch_size: int,
+        flush_interval: float,
+        max_queue_size: int,
+        block_when_full: bool,
+        http2: bool,
+        max_connections: int,
+        keepalive_expiry: float,
     ):
         self.api_key = api_key or os.environ.get("FORPROMPT_API_KEY", "")
         self.base_url = (
@@ -77,6 +193,29 @@ class ForPromptLogger:
                 ErrorCode.MISSING_API_KEY
             )
 
+        # Connection settings for the subclass's HTTP client. HTTP/2 falls
+        # back to HTTP/1.1 without h2 or if the server declines it.
+        self._http2 = http2 and HTTP2_AVAILABLE
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(
+                DEFAULT_MAX_KEEPALIVE_CONNECTIONS, max_connections
+            ),
+            keepalive_expiry=keepalive_expiry,
+        )
+
+        self._closed = False
+
+        # Background delivery state
+        self._enable_batching = enable_batching
+        # A larger batch would be rejected whole by the server
+        self._batch_size = min(max(batch_size, 1), MAX_BATCH_SIZE)
+        self._flush_interval = flush_interval
+        self._max_queue_size = max_queue_size
+        self._block_when_full = block_when_full
+        self._batch_supported = True
+        self.dropped_count = 0
+
     def start_trace(
         self,
         prompt_key: str,
@@ -99,11 +238,258 @@ class ForPromptLogger:
             >>> # ... log messages ...
             >>> logger.end_trace()
         """
-        self._trace_id = trace_id or str(uuid.uuid4())
+        self._trace_id = trace_id or _new_trace_id()
         self._prompt_key = prompt_key
         self._version_number = version_number
         return self._trace_id
 
+    def end_trace(self) -> None:
+        """
+        End the current trace.
+
+        After calling this, start_trace must be called again before logging.
+        """
+        self._trace_id = None
+        self._prompt_key = None
+        self._version_number = None
+
+    def _prepare(
+        self,
+        role: str,
+        content: str,
+        model: Optional[str] = None,
+        input_tokens: Optional[int] = None,
+        output_tokens: Optional[int] = None,
+        duration_ms: Optional[int] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        redact_pii_override: Optional[bool] = None,
+    ) -> bytes:
+        """Redact and encode a log event for the current trace."""
+        if not self._trace_id:
+            self._trace_id = _new_trace_id()
+
+        # Apply PII redaction
+        should_redact = (
+            redact_pii_override
+            if redact_pii_override is not None
+            else self.redact_pii_enabled
+        )
+
+        if should_redact:
+            safe_content, counts = redact_pii_fast(content)
+
+            # Add redaction info to metadata if PII was found
+            if counts is not None:
+                metadata = {
+                    **(metadata or {}),
+                    "pii_redactions": describe_redactions(counts),
+                }
+        else:
+            safe_content = content
+
+        return _json.dumps(_build_payload(
+            trace_id=self._trace_id,
+            prompt_key=self._prompt_key,
+            version_number=self._version_number,
+            role=role,
+            content=safe_content,
+            source=self.source,
+            model=model,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            duration_ms=duration_ms,
+            metadata=metadata,
+        ))
+
+    @staticmethod
+    def _raise_for_response(response: httpx.Response) -> None:
+        """Raise ForPromptError if the server rejected a log request."""
+        status = response.status_code
+
+        # Success - the common case does nothing else
+        if status < 300:
+            return
+
+        try:
+            error_data = _json.loads(response.content)
+        except Exception:
+            error_data = {}
+
+        raise ForPromptError(
+            error_data.get("error", "Failed to log"),
+            status,
+            ErrorCode.LOG_ERROR
+        )
+
+    @staticmethod
+    def _report_batch_errors(response: httpx.Response, count: int) -> None:
+        """Log the events the server couldn't write from an accepted batch."""
+        try:
+            errors = _json.loads(response.content).get("errors")
+        except Exception:
+            return
+        if errors:
+            _log.warning(
+                "Dropped %d of %d log event(s): %s",
+                len(errors), count, errors[0].get("error"),
+            )
+
+    @property
+    def trace_id(self) -> Optional[str]:
+        """Get the current trace ID, or None if no trace is active."""
+        return self._trace_id
+
+    @property
+    def is_tracing(self) -> bool:
+        """Check if a trace is currently active."""
+        return self._trace_id is not None
+
+
+class ForPromptLogger(_LoggerBase):
+    """
+    Logger for tracking conversations and interactions with ForPrompt.
+
+    Supports:
+    - Trace-based conversation logging
+    - Automatic PII redaction
+    - Single request logging
+
+    Args:
+        api_key: Project API key
+        base_url: Base URL for the API
+        source: Source identifier (e.g., "python-sdk", "my-app")
+        redact_pii: Enable PII redaction (default: True)
+        timeout: Request timeout in seconds
+        enable_batching: Queue logs and send them from a background worker in
+            batches. log() returns immediately and delivery errors are logged
+            instead of raised. Call flush() or close() before exiting.
+        batch_size: Maximum events per batch request, capped at 100
+            (default: 64)
+        flush_interval: Seconds to wait for a batch to fill (default: 0.05)
+        max_queue_size: Maximum queued events (default: 10000)
+        block_when_full: Block log() when the queue is full instead of
+            dropping the event (default: False)
+        http2: Multiplex logs over HTTP/2 when the server supports it.
+            Requires the ``http2`` extra (``pip install forprompt[http2]``).
+            (default: True)
+        max_connections: Maximum pooled connections (default: 100)
+        keepalive_expiry: Seconds an idle connection is kept open
+            (default: 30.0)
+
+    Example:
+        >>> logger = ForPromptLogger(api_key="fp_proj_xxx")
+        >>> trace_id = logger.start_trace("my-prompt")
+        >>> logger.log(role="user", content="Hello!")
+        >>> logger.log(role="assistant", content="Hi there!")
+        >>> logger.end_trace()
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        source: str = "python-sdk",
+        redact_pii: bool = True,
+        timeout: float = DEFAULT_TIMEOUT,
+        enable_batching: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        block_when_full: bool = False,
+        http2: bool = True,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+    ):
+        super().__init__(
+            api_key=api_key,
+            base_url=base_url,
+            source=source,
+            redact_pii=redact_pii,
+            timeout=timeout,
+            enable_batching=enable_batching,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            max_queue_size=max_queue_size,
+            block_when_full=block_when_full,
+            http2=http2,
+            max_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+
+        # Persistent client so repeated logs reuse pooled connections
+        self._client = self._new_client()
+        self._queue: "Optional[queue.Queue[Any]]" = (
+            queue.Queue(maxsize=max_queue_size) if enable_batching else None
+        )
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def _new_client(self) -> httpx.Client:
+        """Build the pooled HTTP client."""
+        return httpx.Client(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            http2=self._http2,
+            limits=self._limits,
+            headers={
+                "Content-Type": "application/json",
+                "X-API-Key": self.api_key,
+            },
+        )
+
+    def _check_fork(self) -> None:
+        """Drop state inherited from the parent process after os.fork()."""
+        if self._pid == os.getpid():
+            return
+        # The parent's worker didn't survive the fork, its queued events
+        # belong to the parent, and pooled sockets would be shared with it.
+        # The dead worker is left in place so _enqueue starts a new one.
+        self._pid = os.getpid()
+        self._client = self._new_client()
+        self._worker_lock = threading.Lock()
+        if self._queue is not None:
+            self._queue = queue.Queue(maxsize=self._max_queue_size)
+
+    def close(self) -> None:
+        """
+        Deliver queued logs and close the underlying HTTP client.
+
+        Safe to call more than once.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._check_fork()
+        # Let the interpreter free this logger instead of keeping it for exit
+        atexit.unregister(self.close)
+
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+        if worker is not None and self._queue is not None:
+            self._queue.put(_STOP)
+            worker.join()
+
+        self._client.close()
+
+    def flush(self) -> None:
+        """Block until every queued log has been sent."""
+        self._check_fork()
+        worker = self._worker
+        if self._queue is not None and worker is not None and worker.is_alive():
+            self._queue.join()
+
+    def __enter__(self) -> "ForPromptLogger":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
     def log(
         self,
         role: str,
@@ -140,68 +526,108 @@ class ForPromptLogger:
             ...     output_tokens=10
             ... )
         """
-        if not self._trace_id:
-            self._trace_id = str(uuid.uuid4())
-
-        # Apply PII redaction
-        should_redact = (
-            redact_pii_override
-            if redact_pii_override is not None
-            else self.redact_pii_enabled
+        body = self._prepare(
+            role=role,
+            content=content,
+            model=model,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            duration_ms=duration_ms,
+            metadata=metadata,
+            redact_pii_override=redact_pii_override,
         )
-
-        if should_redact:
-            result = redact_pii(content, PIIRedactionConfig(enabled=True))
-            safe_content = result.redacted
-
-            # Add redaction info to metadata if PII was found
-            if result.has_pii:
-                metadata = metadata or {}
-                metadata["pii_redactions"] = result.redactions
-        else:
-            safe_content = content
-
-        payload = {
-            "traceId": self._trace_id,
-            "promptKey": self._prompt_key or "unknown",
-            "versionNumber": self._version_number,
-            "type": "message",
-            "role": role,
-            "content": safe_content,
-            "model": model,
-            "inputTokens": input_tokens,
-            "outputTokens": output_tokens,
-            "durationMs": duration_ms,
-            "source": self.source,
-            "metadata": metadata,
-        }
-
-        # Remove None values
-        payload = {k: v for k, v in payload.items() if v is not None}
-
-        try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.post(
-                    f"{self.base_url}/api/log",
-                    headers={
-                        "Content-Type": "application/json",
-                        "X-API-Key": self.api_key,
-                    },
-                    json=payload,
+        self._check_fork()
+
+        if self._enable_batching:
+            self._enqueue(body)
+            return
+
+        self._post(LOG_PATH, body)
+
+    def _enqueue(self, body: bytes) -> None:
+        """Queue an event for the background worker."""
+        assert self._queue is not None
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                if self._worker is None:
+                    # Deliver whatever is still queued when the interpreter exits
+                    atexit.register(self.close)
+                self._worker = threading.Thread(
+                    target=self._run_worker,
+                    name="forprompt-logger",
+                    daemon=True,
                 )
+                self._worker.start()
 
-                if not response.is_success:
-                    try:
-                        error_data = response.json()
-                    except Exception:
-                        error_data = {}
-
-                    raise ForPromptError(
-                        error_data.get("error", "Failed to log"),
-                        response.status_code,
-                        ErrorCode.LOG_ERROR
-                    )
-
+        try:
+            if self._block_when_full:
+                self._queue.put(body)
+            else:
+                self._queue.put_nowait(body)
+        except queue.Full:
+            self.dropped_count += 1
+
+    def _run_worker(self) -> None:
+        """Drain the queue, sending events in batches."""
+        assert self._queue is not None
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                return
+
+            batch: List[bytes] = [item]
+            stop = False
+            deadline = time.monotonic() + self._flush_interval
+            while len(batch) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+
+            try:
+                self._deliver(batch)
+            except Exception:
+                _log.exception("Failed to deliver %d log event(s)", len(batch))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            if stop:
+                self._queue.task_done()
+                return
+
+    def _deliver(self, events: List[bytes]) -> None:
+        """Send a batch of events, falling back to one request per event."""
+        if self._batch_supported:
+            try:
+                response = self._post(LOG_BATCH_PATH, _encode_batch(events))
+                self._report_batch_errors(response, len(events))
+                return
+            except ForPromptError as e:
+                if e.status_code not in (404, 405):
+                    _log.warning("Dropped %d log event(s): %s", len(events), e)
+                    return
+                # Server predates the batch endpoint
+                self._batch_supported = False
+
+        for event in events:
+            try:
+                self._post(LOG_PATH, event)
+            except ForPromptError as e:
+                _log.warning("Dropped log event: %s", e)
+
+    def _post(self, path: str, body: bytes) -> httpx.Response:
+        """POST an encoded JSON body, raising ForPromptError on failure."""
+        try:
+            response = self._client.post(path, content=body)
         except httpx.RequestError as e:
             raise ForPromptError(
                 f"Network error: {str(e)}",
@@ -209,15 +635,8 @@ class ForPromptLogger:
                 ErrorCode.NETWORK_ERROR
             )
 
-    def end_trace(self) -> None:
-        """
-        End the current trace.
-
-        After calling this, start_trace must be called again before logging.
-        """
-        self._trace_id = None
-        self._prompt_key = None
-        self._version_number = None
+        self._raise_for_response(response)
+        return response
 
     def log_request(
         self,
@@ -273,22 +692,12 @@ class ForPromptLogger:
         self.end_trace()
         return trace_id
 
-    @property
-    def trace_id(self) -> Optional[str]:
-        """Get the current trace ID, or None if no trace is active."""
-        return self._trace_id
-
-    @property
-    def is_tracing(self) -> bool:
-        """Check if a trace is currently active."""
-        return self._trace_id is not None
-
 
-class AsyncForPromptLogger:
+class AsyncForPromptLogger(_LoggerBase):
     """
     Async logger for tracking conversations with ForPrompt.
 
-    Same interface as ForPromptLogger but with async methods.
+    Same interface and arguments as ForPromptLogger but with async methods.
 
     Example:
         >>> async def main():
@@ -306,37 +715,109 @@ class AsyncForPromptLogger:
         source: str = "python-sdk",
         redact_pii: bool = True,
         timeout: float = DEFAULT_TIMEOUT,
+        enable_batching: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        block_when_full: bool = False,
+        http2: bool = True,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
     ):
-        self.api_key = api_key or os.environ.get("FORPROMPT_API_KEY", "")
-        self.base_url = (
-            base_url or os.environ.get("FORPROMPT_BASE_URL", DEFAULT_BASE_URL)
-        ).rstrip("/")
-        self.source = source
-        self.redact_pii_enabled = redact_pii
-        self.timeout = timeout
+        super().__init__(
+            api_key=api_key,
+            base_url=base_url,
+            source=source,
+            redact_pii=redact_pii,
+            timeout=timeout,
+            enable_batching=enable_batching,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            max_queue_size=max_queue_size,
+            block_when_full=block_when_full,
+            http2=http2,
+            max_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
 
-        self._trace_id: Optional[str] = None
-        self._prompt_key: Optional[str] = None
-        self._version_number: Optional[int] = None
+        # Persistent client so repeated logs reuse pooled connections. Its
+        # connections belong to the event loop that first uses it.
+        self._client = self._new_client()
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Created on first use so they bind to the running event loop
+        self._queue: "Optional[asyncio.Queue[bytes]]" = None
+        self._worker: "Optional[asyncio.Task[None]]" = None
+
+    def _new_client(self) -> httpx.AsyncClient:
+        """Build the pooled HTTP client."""
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            http2=self._http2,
+            limits=self._limits,
+            headers={
+                "Content-Type": "application/json",
+                "X-API-Key": self.api_key,
+            },
+        )
 
-        if not self.api_key:
-            raise ForPromptError(
-                "API key is required.",
-                401,
-                ErrorCode.MISSING_API_KEY
-            )
+    def _check_loop(self) -> None:
+        """
+        Drop state bound to an earlier event loop.
 
-    def start_trace(
+        A logger reused from a new loop (e.g. a second asyncio.run())
+        replaces its pooled client and starts a new queue and worker.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client_loop is loop:
+            return
+        if self._client_loop is not None:
+            self._client = self._new_client()
+            self._queue = None
+            self._worker = None
+        self._client_loop = loop
+
+    async def aclose(self) -> None:
+        """
+        Deliver queued logs and close the underlying HTTP client.
+
+        Safe to call more than once.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        await self.flush()
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        await self._client.aclose()
+
+    async def flush(self) -> None:
+        """Wait until every queued log has been sent."""
+        self._check_loop()
+        if (
+            self._queue is not None
+            and self._worker is not None
+            and not self._worker.done()
+        ):
+            await self._queue.join()
+
+    async def __aenter__(self) -> "AsyncForPromptLogger":
+        return self
+
+    async def __aexit__(
         self,
-        prompt_key: str,
-        trace_id: Optional[str] = None,
-        version_number: Optional[int] = None
-    ) -> str:
-        """Start a new trace."""
-        self._trace_id = trace_id or str(uuid.uuid4())
-        self._prompt_key = prompt_key
-        self._version_number = version_number
-        return self._trace_id
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
 
     async def log(
         self,
@@ -350,64 +831,83 @@ class AsyncForPromptLogger:
         redact_pii_override: Optional[bool] = None,
     ) -> None:
         """Log a message in the current trace (async)."""
-        if not self._trace_id:
-            self._trace_id = str(uuid.uuid4())
-
-        should_redact = (
-            redact_pii_override
-            if redact_pii_override is not None
-            else self.redact_pii_enabled
+        body = self._prepare(
+            role=role,
+            content=content,
+            model=model,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            duration_ms=duration_ms,
+            metadata=metadata,
+            redact_pii_override=redact_pii_override,
         )
+        self._check_loop()
 
-        if should_redact:
-            result = redact_pii(content, PIIRedactionConfig(enabled=True))
-            safe_content = result.redacted
-            if result.has_pii:
-                metadata = metadata or {}
-                metadata["pii_redactions"] = result.redactions
-        else:
-            safe_content = content
-
-        payload = {
-            "traceId": self._trace_id,
-            "promptKey": self._prompt_key or "unknown",
-            "versionNumber": self._version_number,
-            "type": "message",
-            "role": role,
-            "content": safe_content,
-            "model": model,
-            "inputTokens": input_tokens,
-            "outputTokens": output_tokens,
-            "durationMs": duration_ms,
-            "source": self.source,
-            "metadata": metadata,
-        }
-
-        payload = {k: v for k, v in payload.items() if v is not None}
+        if self._enable_batching:
+            await self._enqueue(body)
+            return
 
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/log",
-                    headers={
-                        "Content-Type": "application/json",
-                        "X-API-Key": self.api_key,
-                    },
-                    json=payload,
-                )
+        await self._post(LOG_PATH, body)
 
-                if not response.is_success:
-                    try:
-                        error_data = response.json()
-                    except Exception:
-                        error_data = {}
+    async def _enqueue(self, body: bytes) -> None:
+        """Queue an event for the background worker."""
+        if self._queue is None or self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue(maxsize=self._max_queue_size)
+            self._worker = asyncio.ensure_future(self._run_worker(self._queue))
 
-                    raise ForPromptError(
-                        error_data.get("error", "Failed to log"),
-                        response.status_code,
-                        ErrorCode.LOG_ERROR
-                    )
+        if self._block_when_full:
+            await self._queue.put(body)
+            return
+        try:
+            self._queue.put_nowait(body)
+        except asyncio.QueueFull:
+            self.dropped_count += 1
 
+    async def _run_worker(
+        self,
+        events: "asyncio.Queue[bytes]"
+    ) -> None:
+        """Drain the queue, sending events in batches."""
+        while True:
+            batch = [await events.get()]
+            if events.qsize() < self._batch_size - 1:
+                # Give the batch a moment to fill
+                await asyncio.sleep(self._flush_interval)
+            while len(batch) < self._batch_size and not events.empty():
+                batch.append(events.get_nowait())
+
+            try:
+                await self._deliver(batch)
+            except Exception:
+                _log.exception("Failed to deliver %d log event(s)", len(batch))
+            finally:
+                for _ in batch:
+                    events.task_done()
+
+    async def _deliver(self, events: List[bytes]) -> None:
+        """Send a batch of events, falling back to one request per event."""
+        if self._batch_supported:
+            try:
+                response = await self._post(LOG_BATCH_PATH, _encode_batch(events))
+                self._report_batch_errors(response, len(events))
+                return
+            except ForPromptError as e:
+                if e.status_code not in (404, 405):
+                    _log.warning("Dropped %d log event(s): %s", len(events), e)
+                    return
+                # Server predates the batch endpoint
+                self._batch_supported = False
+
+        for event in events:
+            try:
+                await self._post(LOG_PATH, event)
+            except ForPromptError as e:
+                _log.warning("Dropped log event: %s", e)
+
+    async def _post(self, path: str, body: bytes) -> httpx.Response:
+        """POST an encoded JSON body, raising ForPromptError on failure."""
+        try:
+            response = await self._client.post(path, content=body)
         except httpx.RequestError as e:
             raise ForPromptError(
                 f"Network error: {str(e)}",
@@ -415,18 +915,5 @@ class AsyncForPromptLogger:
                 ErrorCode.NETWORK_ERROR
             )
 
-    def end_trace(self) -> None:
-        """End the current trace."""
-        self._trace_id = None
-        self._prompt_key = None
-        self._version_number = None
-
-    @property
-    def trace_id(self) -> Optional[str]:
-        """Get the current trace ID."""
-        return self._trace_id
-
-    @property
-    def is_tracing(self) -> bool:
-        """Check if a trace is active."""
-        return self._trace_id is not None
+        self._raise_for_response(response)
+        return response
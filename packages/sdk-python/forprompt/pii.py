@@ -13,16 +13,20 @@ Supported PII types:
 """
 
 import re
-from typing import List, Optional, Dict, Tuple
+from functools import lru_cache
+from typing import Callable, FrozenSet, List, Optional, Dict, Tuple
 from .types import PIIRedactionConfig, PIIRedactionResult
 
 
 # PII pattern definitions: (name, pattern, replacement)
-PII_PATTERNS: List[Tuple[str, re.Pattern, str]] = [
+PII_PATTERNS: List[Tuple[str, "re.Pattern[str]", str]] = [
     # Email addresses
+    # The local part is capped at its RFC 5321 limit of 64 characters, so a
+    # long run without an "@" costs at most 64 steps per position instead of
+    # rescanning the rest of the run (quadratic time).
     (
         "email",
-        re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"),
+        re.compile(r"[a-zA-Z0-9._%+-]{1,64}@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"),
         "[EMAIL_REDACTED]"
     ),
 
@@ -78,11 +82,175 @@ PII_PATTERNS: List[Tuple[str, re.Pattern, str]] = [
 ]
 
 
+# Cheap probe run before the full patterns. Every pattern needs one of
+# these characters: emails contain "@", IPv6 addresses contain ":" and
+# all other PII types are made of ASCII digits.
+_might_contain_pii = re.compile(r"[@:0-9]").search
+
+
+# Luhn digit values for doubled positions: 2 * d, minus 9 when over 9
+_LUHN_DOUBLED = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
+
+def _passes_luhn(number: str) -> bool:
+    """Check a card number (separators allowed) against the Luhn checksum."""
+    total = 0
+    double = False
+    for ch in reversed(number):
+        if "0" <= ch <= "9":
+            digit = ord(ch) - 48
+            total += _LUHN_DOUBLED[digit] if double else digit
+            double = not double
+    return total % 10 == 0
+
+
+# Extra checks a match must pass to count as PII
+_VALIDATORS: Dict[str, Callable[[str], bool]] = {
+    "credit_card": _passes_luhn,
+    "credit_card_formatted": _passes_luhn,
+}
+
+
+# Names an overlapping span when matches tie on length; higher wins and
+# unlisted patterns rank 0. credit_card_formatted also matches unseparated
+# numbers, so credit_card must outrank it.
+_TIE_PRIORITY: Dict[str, int] = {
+    "credit_card": 2,
+    "credit_card_formatted": 1,
+}
+
+
+_PatternTable = Tuple[Tuple[str, "re.Pattern[str]", str], ...]
+
+
+# Bounded so callers passing many different pattern lists can't grow it
+@lru_cache(maxsize=32)
+def _select_patterns(names: Optional[FrozenSet[str]] = None) -> _PatternTable:
+    """
+    Get the PII_PATTERNS entries to apply, cached per selection.
+
+    Args:
+        names: Pattern names to include (default: all)
+
+    Returns:
+        Tuple of (name, pattern, replacement) in PII_PATTERNS order
+    """
+    return tuple(
+        p for p in PII_PATTERNS
+        if names is None or p[0] in names
+    )
+
+
 def get_available_patterns() -> List[str]:
     """Get list of available PII pattern names."""
     return [name for name, _, _ in PII_PATTERNS]
 
 
+def describe_redactions(counts: Dict[str, int]) -> List[str]:
+    """
+    Summarize redaction counts as human-readable strings.
+
+    Args:
+        counts: Count of each PII type found
+
+    Returns:
+        List like ['email: 1 instance(s)']
+    """
+    return [f"{name}: {count} instance(s)" for name, count in counts.items()]
+
+
+def redact_pii_fast(
+    content: str,
+    config: Optional[PIIRedactionConfig] = None
+) -> Tuple[str, Optional[Dict[str, int]]]:
+    """
+    Redact PII from content without building a PIIRedactionResult.
+
+    Intended for hot paths such as logging, where most content is clean.
+
+    Args:
+        content: The content to redact
+        config: Redaction configuration (default: enabled)
+
+    Returns:
+        Tuple of (redacted content, counts per PII type). Counts is None
+        when no PII was found, in which case content is returned as-is.
+
+    Example:
+        >>> redact_pii_fast("Contact me at john@example.com")
+        ('Contact me at [EMAIL_REDACTED]', {'email': 1})
+        >>> redact_pii_fast("Hello!")
+        ('Hello!', None)
+    """
+    if config is not None and not config.enabled:
+        return content, None
+
+    patterns = _select_patterns(
+        frozenset(config.patterns)
+        if config is not None and config.patterns
+        else None
+    )
+    if not patterns or not _might_contain_pii(content):
+        return content, None
+
+    # Collect every match of every pattern as (start, end, pattern index)
+    spans = sorted(
+        (match.start(), match.end(), index)
+        for index, (name, pattern, _) in enumerate(patterns)
+        for match in pattern.finditer(content)
+        if name not in _VALIDATORS or _VALIDATORS[name](match.group())
+    )
+    if not spans:
+        return content, None
+
+    found: Dict[str, int] = {}
+    parts: List[str] = []
+    position = 0
+
+    def _emit(start: int, end: int, index: int) -> None:
+        name, _, replacement = patterns[index]
+        found[name] = found.get(name, 0) + 1
+        parts.append(content[position:start])
+        parts.append(replacement)
+
+    # Overlapping matches are merged and redacted as one span so no part
+    # of any match survives. The longest match names the span; ties go to
+    # the pattern with the higher _TIE_PRIORITY.
+    def _priority(index: int) -> int:
+        return _TIE_PRIORITY.get(patterns[index][0], 0)
+
+    start, end, best = spans[0]
+    best_length = end - start
+    for span_start, span_end, index in spans[1:]:
+        if span_start < end:
+            length = span_end - span_start
+            if length > best_length or (
+                length == best_length and _priority(index) > _priority(best)
+            ):
+                best, best_length = index, length
+            end = max(end, span_end)
+            continue
+
+        _emit(start, end, best)
+        position = end
+        start, end, best = span_start, span_end, index
+        best_length = end - start
+
+    _emit(start, end, best)
+    parts.append(content[end:])
+    result = "".join(parts)
+
+    # Report in pattern order rather than match order
+    counts = {
+        name: found[name] for name, _, _ in patterns if name in found
+    }
+
+    if config is not None and config.log_stats:
+        print(f"PII redaction: {', '.join(describe_redactions(counts))}")
+
+    return result, counts
+
+
 def redact_pii(
     content: str,
     config: Optional[PIIRedactionConfig] = None
@@ -104,46 +272,15 @@ def redact_pii(
         >>> print(result.redactions)
         ['email: 1 instance(s)', 'phone: 1 instance(s)']
     """
-    if config is None:
-        config = PIIRedactionConfig(enabled=True)
-
-    # Return unchanged if disabled
-    if not config.enabled:
-        return PIIRedactionResult(
-            redacted=content,
-            redactions=[],
-            counts={},
-            has_pii=False
-        )
-
-    result = content
-    redactions: List[str] = []
-    counts: Dict[str, int] = {}
-
-    # Get patterns to use
-    patterns = PII_PATTERNS
-    if config.patterns:
-        patterns = [p for p in PII_PATTERNS if p[0] in config.patterns]
-
-    # Apply each pattern
-    for name, pattern, replacement in patterns:
-        matches = pattern.findall(result)
-        if matches:
-            count = len(matches)
-            counts[name] = count
-            redactions.append(f"{name}: {count} instance(s)")
-            result = pattern.sub(replacement, result)
-
-    has_pii = len(redactions) > 0
-
-    if has_pii and config.log_stats:
-        print(f"PII redaction: {', '.join(redactions)}")
+    redacted, counts = redact_pii_fast(content, config)
+
+    if counts is None:
+        return PIIRedactionResult(redacted=redacted)
 
     return PIIRedactionResult(
-        redacted=result,
-        redactions=redactions,
+        redacted=redacted,
         counts=counts,
-        has_pii=has_pii
+        has_pii=True
     )
 
 
@@ -158,12 +295,16 @@ def contains_pii(content: str, patterns: Optional[List[str]] = None) -> bool:
     Returns:
         True if PII is detected
     """
-    patterns_to_check = PII_PATTERNS
-    if patterns:
-        patterns_to_check = [p for p in PII_PATTERNS if p[0] in patterns]
+    if not _might_contain_pii(content):
+        return False
 
-    for _, pattern, _ in patterns_to_check:
-        if pattern.search(content):
+    selected = _select_patterns(frozenset(patterns) if patterns else None)
+    for name, pattern, _ in selected:
+        validator = _VALIDATORS.get(name)
+        if validator is None:
+            if pattern.search(content):
+                return True
+        elif any(validator(m.group()) for m in pattern.finditer(content)):
             return True
 
     return False
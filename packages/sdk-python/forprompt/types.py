@@ -4,7 +4,7 @@ ForPrompt SDK Type Definitions
 This module defines the data types used throughout the SDK.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Optional, Dict, Any, List
 from enum import Enum
 
@@ -19,6 +19,7 @@ class ErrorCode(str, Enum):
     NETWORK_ERROR = "NETWORK_ERROR"
     SERVER_ERROR = "SERVER_ERROR"
     RETRY_EXHAUSTED = "RETRY_EXHAUSTED"
+    RATE_LIMITED = "RATE_LIMITED"
     LOG_ERROR = "LOG_ERROR"
 
 
@@ -205,11 +206,18 @@ class PIIRedactionResult:
 
     Attributes:
         redacted: The redacted content
-        redactions: Summary of redactions made
-        counts: Count of each PII type found
+        counts: Count of each PII type found, or None if none was found
         has_pii: Whether any PII was found
+        redactions: Summary of redactions made (derived from counts)
     """
     redacted: str
-    redactions: List[str] = field(default_factory=list)
-    counts: Dict[str, int] = field(default_factory=dict)
+    counts: Optional[Dict[str, int]] = None
     has_pii: bool = False
+
+    @property
+    def redactions(self) -> List[str]:
+        """Summary like ['email: 1 instance(s)'], formatted on access."""
+        # Imported here because pii imports this module
+        from .pii import describe_redactions
+
+        return describe_redactions(self.counts) if self.counts else []
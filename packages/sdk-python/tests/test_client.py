@@ -0,0 +1,212 @@
+"""
+Tests for AsyncForPrompt request batching
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from forprompt import AsyncForPrompt, ForPromptError
+from forprompt.client import BATCHER_MAX_SIZE
+from forprompt.types import ErrorCode
+
+BASE_URL = "http://forprompt.test"
+
+
+def prompt_data(key, version=1):
+    return {
+        "key": key,
+        "name": key,
+        "versionNumber": version,
+        "systemPrompt": f"{key} v{version}",
+        "updatedAt": 0,
+    }
+
+
+class FakeServer:
+    """Serves prompts for a MockTransport and records every request."""
+
+    def __init__(self, prompts, batch_supported=True):
+        self.prompts = prompts
+        self.batch_supported = batch_supported
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        if request.url.path == "/api/prompts/batch":
+            if not self.batch_supported:
+                return httpx.Response(404, json={"error": "Not found"})
+            body = json.loads(request.content)
+            version = body.get("version")
+            return httpx.Response(200, json={"prompts": {
+                key: prompt_data(key, version or 1)
+                for key in body["keys"] if key in self.prompts
+            }})
+
+        key = request.url.params["key"]
+        if key not in self.prompts:
+            return httpx.Response(404, json={"error": "Not found"})
+        version = request.url.params.get("version")
+        return httpx.Response(200, json=prompt_data(key, int(version or 1)))
+
+    def batch_bodies(self):
+        return [
+            json.loads(request.content) for request in self.requests
+            if request.url.path == "/api/prompts/batch"
+        ]
+
+
+def make_client(server, **kwargs):
+    client = AsyncForPrompt(
+        api_key="fp_test", base_url=BASE_URL, cache_ttl=0, **kwargs
+    )
+    # Every HTTP client the SDK builds, including after a loop change, is
+    # served by the fake server
+    client._new_client = lambda: httpx.AsyncClient(
+        base_url=BASE_URL, transport=httpx.MockTransport(server)
+    )
+    client._client = client._new_client()
+    return client
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_batch_request():
+    server = FakeServer({"a", "b", "c"})
+    client = make_client(server, enable_batching=True)
+
+    prompts = await asyncio.gather(
+        client.get_prompt("a"),
+        client.get_prompt("b"),
+        client.get_prompt("c"),
+    )
+    await client.aclose()
+
+    assert [p.key for p in prompts] == ["a", "b", "c"]
+    assert len(server.requests) == 1
+    assert sorted(server.batch_bodies()[0]["keys"]) == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_keys_are_sent_once():
+    server = FakeServer({"a"})
+    client = make_client(server, enable_batching=True)
+
+    first, second = await asyncio.gather(
+        client.get_prompt("a"), client.get_prompt("a")
+    )
+    await client.aclose()
+
+    assert first.key == second.key == "a"
+    assert server.batch_bodies() == [{"keys": ["a"]}]
+
+
+@pytest.mark.asyncio
+async def test_lookups_are_grouped_by_version():
+    server = FakeServer({"a", "b"})
+    client = make_client(server, enable_batching=True)
+
+    active, pinned = await asyncio.gather(
+        client.get_prompt("a"), client.get_prompt("b", version=2)
+    )
+    await client.aclose()
+
+    assert active.version_number == 1
+    assert pinned.version_number == 2
+    bodies = sorted(server.batch_bodies(), key=lambda body: body["keys"])
+    assert bodies == [{"keys": ["a"]}, {"keys": ["b"], "version": 2}]
+
+
+@pytest.mark.asyncio
+async def test_large_bursts_are_split_at_max_size():
+    keys = [f"p{i}" for i in range(BATCHER_MAX_SIZE + 8)]
+    server = FakeServer(set(keys))
+    client = make_client(server, enable_batching=True)
+
+    prompts = await asyncio.gather(*(client.get_prompt(key) for key in keys))
+    await client.aclose()
+
+    assert [p.key for p in prompts] == keys
+    sizes = sorted(len(body["keys"]) for body in server.batch_bodies())
+    assert sizes == [8, BATCHER_MAX_SIZE]
+
+
+@pytest.mark.asyncio
+async def test_missing_prompt_fails_only_its_own_lookup():
+    server = FakeServer({"a"})
+    client = make_client(server, enable_batching=True)
+
+    found, missing = await asyncio.gather(
+        client.get_prompt("a"),
+        client.get_prompt("missing"),
+        return_exceptions=True,
+    )
+    await client.aclose()
+
+    assert found.key == "a"
+    assert isinstance(missing, ForPromptError)
+    assert missing.code == ErrorCode.PROMPT_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_single_requests_without_batch_endpoint():
+    server = FakeServer({"a", "b"}, batch_supported=False)
+    client = make_client(server, enable_batching=True)
+
+    prompts = await asyncio.gather(client.get_prompt("a"), client.get_prompt("b"))
+    later = await client.get_prompt("a")
+    await client.aclose()
+
+    assert [p.key for p in prompts] == ["a", "b"]
+    assert later.key == "a"
+    assert not client._batch_supported
+    paths = [request.url.path for request in server.requests]
+    assert paths.count("/api/prompts/batch") == 1
+    assert paths.count("/api/prompts") == 3
+
+
+@pytest.mark.asyncio
+async def test_cancelled_lookup_does_not_break_the_batch():
+    server = FakeServer({"a", "b"})
+    client = make_client(server, enable_batching=True)
+
+    cancelled = asyncio.ensure_future(client.get_prompt("a"))
+    kept = asyncio.ensure_future(client.get_prompt("b"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    prompt = await kept
+    await client.aclose()
+
+    assert prompt.key == "b"
+    assert cancelled.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_close_sends_queued_lookups():
+    server = FakeServer({"a"})
+    client = make_client(server, enable_batching=True)
+
+    lookup = asyncio.ensure_future(client.get_prompt("a"))
+    batcher = client._batcher
+    # Wait until the lookup has been queued
+    while batcher._worker is None:
+        await asyncio.sleep(0)
+    await client.aclose()
+
+    # Sent before the HTTP client was closed
+    assert len(server.requests) == 1
+    assert (await lookup).key == "a"
+
+
+def test_client_survives_a_new_event_loop():
+    server = FakeServer({"a"})
+    client = make_client(server, enable_batching=True)
+
+    first = asyncio.run(client.get_prompt("a"))
+    second = asyncio.run(client.get_prompt("a"))
+    asyncio.run(client.aclose())
+
+    assert first.key == second.key == "a"
+    assert len(server.requests) == 2
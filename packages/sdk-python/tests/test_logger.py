@@ -0,0 +1,264 @@
+"""
+Tests for background log delivery
+"""
+
+import asyncio
+import gc
+import json
+import os
+import threading
+import weakref
+
+import httpx
+import pytest
+
+from forprompt import AsyncForPromptLogger, ForPromptLogger
+from forprompt.logger import MAX_BATCH_SIZE
+
+BASE_URL = "http://forprompt.test"
+
+
+class FakeServer:
+    """Accepts logs for a MockTransport and records every event received."""
+
+    def __init__(self, batch_supported=True, rejected=()):
+        self.batch_supported = batch_supported
+        self.rejected = rejected
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        body = json.loads(request.content)
+        with self.lock:
+            self.requests.append((request.url.path, body))
+        if request.url.path == "/api/log/batch":
+            if not self.batch_supported:
+                return httpx.Response(404, json={"error": "Not found"})
+            errors = [
+                {"index": index, "error": "Invalid event"}
+                for index in self.rejected if index < len(body["events"])
+            ]
+            return httpx.Response(200, json={
+                "success": not errors,
+                "count": len(body["events"]) - len(errors),
+                "errors": errors,
+            })
+        return httpx.Response(200, json={"success": True})
+
+    def events(self):
+        with self.lock:
+            requests = list(self.requests)
+        events = []
+        for path, body in requests:
+            if path != "/api/log/batch":
+                events.append(body)
+            elif self.batch_supported:
+                events.extend(body["events"])
+        return events
+
+    def paths(self):
+        with self.lock:
+            return [path for path, _ in self.requests]
+
+
+def make_logger(server, logger_class=ForPromptLogger, **kwargs):
+    logger = logger_class(
+        api_key="fp_test",
+        base_url=BASE_URL,
+        enable_batching=True,
+        **kwargs,
+    )
+    client_class = (
+        httpx.AsyncClient if logger_class is AsyncForPromptLogger
+        else httpx.Client
+    )
+    # Every HTTP client the SDK builds, including after a fork or loop
+    # change, is served by the fake server
+    logger._new_client = lambda: client_class(
+        base_url=BASE_URL, transport=httpx.MockTransport(server)
+    )
+    logger._client = logger._new_client()
+    return logger
+
+
+def test_logs_are_delivered_in_batches():
+    server = FakeServer()
+    logger = make_logger(server, batch_size=10, flush_interval=0.5)
+
+    logger.start_trace("my-prompt")
+    for i in range(25):
+        logger.log(role="user", content=f"message {i}")
+    logger.flush()
+    logger.close()
+
+    assert [e["content"] for e in server.events()] == [
+        f"message {i}" for i in range(25)
+    ]
+    assert set(server.paths()) == {"/api/log/batch"}
+    assert all(
+        len(body["events"]) <= 10 for _, body in server.requests
+    )
+
+
+def test_batch_size_is_capped_at_server_limit():
+    logger = make_logger(FakeServer(), batch_size=MAX_BATCH_SIZE * 5)
+
+    assert logger._batch_size == MAX_BATCH_SIZE
+    logger.close()
+
+
+def test_falls_back_to_single_requests_without_batch_endpoint():
+    server = FakeServer(batch_supported=False)
+    logger = make_logger(server)
+
+    for i in range(3):
+        logger.log(role="user", content=f"message {i}")
+    logger.flush()
+    logger.log(role="user", content="message 3")
+    logger.close()
+
+    assert [e["content"] for e in server.events()] == [
+        f"message {i}" for i in range(4)
+    ]
+    assert server.paths().count("/api/log/batch") == 1
+    assert server.paths().count("/api/log") == 4
+
+
+def test_rejected_events_are_reported(caplog):
+    server = FakeServer(rejected=[1])
+    logger = make_logger(server, flush_interval=0.5)
+
+    logger.log(role="user", content="first")
+    logger.log(role="user", content="second")
+    logger.close()
+
+    assert "Dropped 1 of 2 log event(s): Invalid event" in caplog.text
+
+
+def test_metadata_is_sent_as_json_string():
+    server = FakeServer()
+    logger = make_logger(server)
+
+    logger.log(role="user", content="mail john@example.com", metadata={"a": 1})
+    logger.close()
+
+    (event,) = server.events()
+    assert event["content"] == "mail [EMAIL_REDACTED]"
+    assert json.loads(event["metadata"]) == {
+        "a": 1,
+        "pii_redactions": ["email: 1 instance(s)"],
+    }
+
+
+def test_full_queue_drops_events():
+    server = FakeServer()
+    sending = threading.Event()
+    release = threading.Event()
+
+    def slow_server(request):
+        sending.set()
+        release.wait(5)
+        return server(request)
+
+    logger = make_logger(slow_server, max_queue_size=1, flush_interval=0)
+
+    # The worker holds the first event while the queue fills up
+    logger.log(role="user", content="sending")
+    assert sending.wait(5)
+    logger.log(role="user", content="queued")
+    logger.log(role="user", content="dropped")
+    release.set()
+    logger.close()
+
+    assert logger.dropped_count == 1
+    assert [e["content"] for e in server.events()] == ["sending", "queued"]
+
+
+def test_close_delivers_queued_logs_and_releases_logger():
+    server = FakeServer()
+    logger = make_logger(server, flush_interval=0.5)
+
+    logger.log(role="user", content="hello")
+    worker = logger._worker
+    logger.close()
+    logger.close()
+
+    assert [e["content"] for e in server.events()] == ["hello"]
+    assert not worker.is_alive()
+
+    # close() unregisters the atexit hook that kept the logger alive
+    ref = weakref.ref(logger)
+    del logger
+    gc.collect()
+    assert ref() is None
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_delivers_its_own_logs():
+    server = FakeServer()
+    logger = make_logger(server)
+
+    logger.log(role="user", content="parent")
+    logger.flush()
+    parent_client = logger._client
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        # Child: report what this process sent, then exit without cleanup
+        code = 1
+        try:
+            logger.log(role="user", content="child")
+            logger.flush()
+            sent = [e["content"] for e in server.events()]
+            fresh = logger._client is not parent_client
+            os.write(write_fd, json.dumps([sent, fresh]).encode())
+            code = 0
+        finally:
+            os._exit(code)
+
+    os.close(write_fd)
+    _, status = os.waitpid(pid, 0)
+    with os.fdopen(read_fd, "rb") as pipe:
+        sent, fresh = json.loads(pipe.read())
+    logger.close()
+
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+    assert sent == ["parent", "child"]
+    assert fresh
+    # The child's events never reach the parent's queue or server
+    assert [e["content"] for e in server.events()] == ["parent"]
+
+
+@pytest.mark.asyncio
+async def test_async_logs_are_delivered_in_batches():
+    server = FakeServer()
+    logger = make_logger(server, AsyncForPromptLogger, batch_size=10)
+
+    logger.start_trace("my-prompt")
+    for i in range(25):
+        await logger.log(role="user", content=f"message {i}")
+    await logger.flush()
+    await logger.aclose()
+
+    assert [e["content"] for e in server.events()] == [
+        f"message {i}" for i in range(25)
+    ]
+    assert all(
+        len(body["events"]) <= 10 for _, body in server.requests
+    )
+
+
+def test_async_logger_survives_a_new_event_loop():
+    server = FakeServer()
+    logger = make_logger(server, AsyncForPromptLogger)
+
+    async def log(content):
+        await logger.log(role="user", content=content)
+        await logger.flush()
+
+    asyncio.run(log("first"))
+    asyncio.run(log("second"))
+    asyncio.run(logger.aclose())
+
+    assert [e["content"] for e in server.events()] == ["first", "second"]
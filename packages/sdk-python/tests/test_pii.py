@@ -0,0 +1,135 @@
+"""
+Tests for PII detection and redaction
+"""
+
+import time
+
+import pytest
+
+from forprompt.pii import (
+    PII_PATTERNS,
+    contains_pii,
+    describe_redactions,
+    redact_pii,
+    redact_pii_fast,
+)
+from forprompt.types import PIIRedactionConfig
+
+
+# Catastrophic backtracking takes seconds on these inputs; linear matching
+# takes a few milliseconds
+TIME_LIMIT = 0.1
+
+ADVERSARIAL_INPUTS = {
+    "digits": "1" * 100000 + "x",
+    "dashed digits": "1-" * 50000,
+    "dotted digits": "1." * 50000,
+    "spaced digits": "1 " * 50000,
+    "local part without @": "a" * 100000,
+    "dotted local part": "a." * 50000 + "@",
+}
+
+
+@pytest.mark.parametrize("name,pattern", [(n, p) for n, p, _ in PII_PATTERNS])
+@pytest.mark.parametrize("label", list(ADVERSARIAL_INPUTS))
+def test_patterns_run_in_linear_time(name, pattern, label):
+    content = ADVERSARIAL_INPUTS[label]
+
+    start = time.perf_counter()
+    for _ in pattern.finditer(content):
+        pass
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < TIME_LIMIT, f"{name} took {elapsed:.3f}s on {label}"
+
+
+def test_redacts_email():
+    result = redact_pii("Contact me at john@example.com for details")
+
+    assert result.redacted == "Contact me at [EMAIL_REDACTED] for details"
+    assert result.has_pii
+    assert result.counts == {"email": 1}
+
+
+@pytest.mark.parametrize("content", [
+    "foo@bar.com_baz@qux.org",
+    "a@b.com.c@d.com",
+])
+def test_redacts_adjacent_emails(content):
+    redacted, counts = redact_pii_fast(content)
+
+    assert redacted == "[EMAIL_REDACTED][EMAIL_REDACTED]"
+    assert counts == {"email": 2}
+
+
+def test_email_local_part_is_capped_at_64_characters():
+    local = "x" * 70 + "y" * 64
+    redacted, counts = redact_pii_fast(f"{local}@example.com")
+
+    # Only the last 64 characters of an over-long local part are matched
+    assert redacted == "x" * 70 + "[EMAIL_REDACTED]"
+    assert counts == {"email": 1}
+
+
+def test_redacts_phone_and_ssn():
+    redacted, counts = redact_pii_fast("Phone 555.123.4567, ssn 123-45-6789")
+
+    assert redacted == "Phone [PHONE_REDACTED], ssn [SSN_REDACTED]"
+    assert counts == {"phone": 1, "ssn": 1}
+
+
+def test_unformatted_card_is_labelled_credit_card():
+    redacted, counts = redact_pii_fast("card 4111111111111111")
+
+    assert redacted == "card [CC_REDACTED]"
+    assert counts == {"credit_card": 1}
+
+
+def test_formatted_card_is_labelled_credit_card_formatted():
+    redacted, counts = redact_pii_fast("card 4111 1111 1111 1111")
+
+    assert redacted == "card [CC_REDACTED]"
+    assert counts == {"credit_card_formatted": 1}
+
+
+def test_card_failing_luhn_is_not_a_card():
+    _, counts = redact_pii_fast("card 4111-1111-1111-1112")
+
+    assert counts is None
+
+
+def test_clean_content_is_returned_unchanged():
+    content = "This is a clean message"
+
+    assert redact_pii_fast(content) == (content, None)
+    assert not redact_pii(content).has_pii
+    assert not contains_pii(content)
+
+
+def test_disabled_config_skips_redaction():
+    content = "Contact me at john@example.com"
+    result = redact_pii(content, PIIRedactionConfig(enabled=False))
+
+    assert result.redacted == content
+    assert not result.has_pii
+
+
+def test_pattern_selection():
+    config = PIIRedactionConfig(patterns=["phone"])
+    redacted, counts = redact_pii_fast(
+        "john@example.com or 555-123-4567", config
+    )
+
+    assert redacted == "john@example.com or [PHONE_REDACTED]"
+    assert counts == {"phone": 1}
+
+
+def test_describe_redactions():
+    assert describe_redactions({"email": 2}) == ["email: 2 instance(s)"]
+
+
+def test_result_redactions_match_describe_redactions():
+    result = redact_pii("john@example.com or 555-123-4567")
+
+    assert result.redactions == describe_redactions(result.counts)
+    assert redact_pii("clean").redactions == []